@@ -44,6 +44,7 @@ let package = Package(
             ],
             resources: [
                 .process("../../Resources/resume.yaml"),
+                .process("../../Resources/resume.json"),
             ]
         ),
         .testTarget(
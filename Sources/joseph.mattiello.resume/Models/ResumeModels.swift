@@ -142,6 +142,24 @@ struct Education: Codable {
     }
 }
 
+/// Precompiled resume artifact written by generate_resume_artifact.py
+/// Only the fields the TUI needs are decoded; the search index is ignored.
+struct ResumeArtifact: Decodable {
+    static let supportedFormatVersion = 1
+
+    let formatVersion: Int
+    let checksum: String
+    let sourceSHA256: String
+    let resume: Resume
+
+    enum CodingKeys: String, CodingKey {
+        case formatVersion = "format_version"
+        case checksum
+        case sourceSHA256 = "source_sha256"
+        case resume
+    }
+}
+
 /// State for collapsible sections
 struct CollapsibleState: Codable {
     var experienceStates: [String: Bool] = [:]
@@ -1,4 +1,5 @@
 import Foundation
+import CryptoKit
 import Cncurses
 import Yams
 import Darwin // For setlocale, LC_ALL
@@ -131,9 +132,8 @@ struct ResumeTUI {
         return try decoder.decode(Resume.self, from: jsonData)
     }
 
-    // MARK: - Resume Data Handling
-    @MainActor
-    static func loadResumeData() -> Resume? {
+    /// Locations searched for resume.yaml, in priority order.
+    static func resumeYAMLCandidateURLs() -> [URL?] {
         let fileName = "resume"
         let fileExtension = "yaml"
         let resourcesSubDir = "Resources"
@@ -157,7 +157,21 @@ struct ResumeTUI {
         urlsToTry.append(currentDirectoryURL.appendingPathComponent(resourcesSubDir).appendingPathComponent("\(fileName).\(fileExtension)"))
         urlsToTry.append(currentDirectoryURL.appendingPathComponent("\(fileName).\(fileExtension)"))
 
-        for urlOptional in urlsToTry {
+        return urlsToTry
+    }
+
+    // MARK: - Resume Data Handling
+    @MainActor
+    static func loadResumeData() -> Resume? {
+        // Prefer the precompiled JSON artifact; it decodes much faster than YAML.
+        if let resume = loadResumeArtifact() {
+            return resume
+        }
+
+        let fileName = "resume"
+        let fileExtension = "yaml"
+
+        for urlOptional in resumeYAMLCandidateURLs() {
             guard let url = urlOptional else { continue }
 
             // Check if file exists at this URL before attempting to load
@@ -181,6 +195,50 @@ struct ResumeTUI {
         return nil
     }
 
+    @MainActor
+    static func loadResumeArtifact() -> Resume? {
+        let fileName = "resume"
+        let fileExtension = "json"
+        let resourcesSubDir = "Resources"
+
+        var urlsToTry: [URL?] = []
+        urlsToTry.append(Bundle.main.url(forResource: fileName, withExtension: fileExtension, subdirectory: resourcesSubDir))
+        urlsToTry.append(Bundle.main.url(forResource: fileName, withExtension: fileExtension))
+        if let executableURL = Bundle.main.executableURL?.deletingLastPathComponent() {
+            urlsToTry.append(executableURL.appendingPathComponent(resourcesSubDir).appendingPathComponent("\(fileName).\(fileExtension)"))
+            urlsToTry.append(executableURL.appendingPathComponent("\(fileName).\(fileExtension)"))
+        }
+        let currentDirectoryURL = URL(fileURLWithPath: FileManager.default.currentDirectoryPath)
+        urlsToTry.append(currentDirectoryURL.appendingPathComponent(resourcesSubDir).appendingPathComponent("\(fileName).\(fileExtension)"))
+
+        for urlOptional in urlsToTry {
+            guard let url = urlOptional, FileManager.default.fileExists(atPath: url.path) else { continue }
+
+            tuiState.appendToDebugLog("Attempting to load resume artifact from: \(url.path)")
+            do {
+                let data = try Data(contentsOf: url)
+                let artifact = try JSONDecoder().decode(ResumeArtifact.self, from: data)
+                guard artifact.formatVersion == ResumeArtifact.supportedFormatVersion else {
+                    tuiState.appendToDebugLog("Skipping resume artifact with unsupported format version \(artifact.formatVersion)")
+                    continue
+                }
+                // The artifact is only valid for the resume.yaml it was compiled from.
+                if let yamlURL = resumeYAMLCandidateURLs().compactMap({ $0 }).first(where: { FileManager.default.fileExists(atPath: $0.path) }) {
+                    let yamlDigest = SHA256.hash(data: try Data(contentsOf: yamlURL)).map { String(format: "%02x", $0) }.joined()
+                    guard yamlDigest == artifact.sourceSHA256 else {
+                        tuiState.appendToDebugLog("Resume artifact is stale (\(yamlURL.path) changed); falling back to YAML")
+                        return nil
+                    }
+                }
+                tuiState.appendToDebugLog("Successfully loaded resume artifact \(artifact.checksum.prefix(12)) from \(url.path)")
+                return artifact.resume
+            } catch {
+                tuiState.appendToDebugLog("Error loading resume artifact from \(url.path): \(error)")
+            }
+        }
+        return nil
+    }
+
     // MARK: - Formatting Helpers (Static Methods)
 
     static func getRatingEmoji(rating: Int, maxRating: Int = 5, filledSymbol: String = "⭐", emptySymbol: String = "☆") -> String {
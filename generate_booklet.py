@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Render many resumes into one combined PDF booklet.
+
+Resumes are rendered one after another (WeasyPrint or LaTeX) in a small
+process pool, and each finished PDF is copied object by object straight into
+the booklet file before it is deleted. Nothing from earlier resumes is kept in
+memory except each object's byte offset (for the xref table) and one outline
+entry per candidate, so a booklet of thousands of resumes needs about as much
+memory as a single one. The booklet opens with its outline panel showing one
+bookmark per candidate.
+
+Usage:
+    python generate_booklet.py batch.yaml -o output/booklet.pdf
+    python generate_booklet.py batch.jsonl --backend latex --workers 4
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import yaml
+from pypdf import PdfReader
+from pypdf.generic import (
+    ArrayObject,
+    DictionaryObject,
+    IndirectObject,
+    NameObject,
+    NumberObject,
+    StreamObject,
+    create_string_object,
+)
+
+from latex_driver import compile_latex
+from resume_stream import iter_resumes, load_html_template, slugify
+
+BACKENDS = ('html', 'latex')
+
+# Page attributes a page may inherit from its parent /Pages nodes.
+INHERITED_PAGE_KEYS = ('/Resources', '/MediaBox', '/CropBox', '/Rotate')
+
+
+def render_html_pdf(resume_data, work_dir, base_name, project_root):
+    """Render one resume to PDF with the Jinja template and WeasyPrint. Returns the PDF path."""
+    from resume_pipeline import html_to_pdf
+
+    html_content = load_html_template(project_root).render(resume_data=resume_data)
+    return html_to_pdf(html_content, project_root, os.path.join(work_dir, f"{base_name}.pdf"))
+
+
+def render_latex_pdf(resume_data, work_dir, base_name, project_root):
+    """Render one resume to PDF with the fast LaTeX backend and pdflatex. Returns the PDF path."""
+    from generate_resume_fast import create_latex_source
+
+    tex_path = os.path.join(work_dir, f"{base_name}.tex")
+    with open(tex_path, 'w', encoding='utf-8') as file:
+        file.write(create_latex_source(resume_data))
+    compile_latex(tex_path, work_dir)
+    return os.path.join(work_dir, f"{base_name}.pdf")
+
+
+RENDERERS = {'html': render_html_pdf, 'latex': render_latex_pdf}
+
+
+def _ref(number):
+    return IndirectObject(number, 0, None)
+
+
+class BookletWriter:
+    """Writes a PDF incrementally, appending the pages of other PDFs as they arrive."""
+
+    def __init__(self, file):
+        self.file = file
+        self.offsets = [None]  # offsets[object number]; object 0 is the free-list head
+        self.page_numbers = []
+        self.outline = []  # (title, object number of the candidate's first page)
+        self.pages_number = self._reserve()
+        file.write(b'%PDF-1.7\n%\xe2\xe3\xcf\xd3\n')
+
+    def _reserve(self):
+        self.offsets.append(None)
+        return len(self.offsets) - 1
+
+    def _write_object(self, number, obj):
+        self.offsets[number] = self.file.tell()
+        self.file.write(f"{number} 0 obj\n".encode('ascii'))
+        obj.write_to_stream(self.file)
+        self.file.write(b"\nendobj\n")
+
+    def append_pdf(self, pdf_path, title):
+        """Copy every page of ``pdf_path`` (and what the pages reference) into the booklet.
+
+        Returns the number of pages appended.
+        """
+        reader = PdfReader(pdf_path)
+        if reader.is_encrypted:
+            raise ValueError(f"{pdf_path} is encrypted")
+
+        numbers = {}
+        pending = deque()
+
+        def remap(value):
+            """Copy ``value`` with every reference renumbered into the booklet."""
+            if isinstance(value, IndirectObject):
+                key = (value.idnum, value.generation)
+                if key not in numbers:
+                    numbers[key] = self._reserve()
+                    pending.append(value)
+                return _ref(numbers[key])
+            if isinstance(value, StreamObject):
+                # Keep the stream bytes exactly as stored; /Length is rewritten on output.
+                copied = value.__class__()
+                copied._data = value._data
+                for key, item in value.items():
+                    if key != '/Length':
+                        copied[key] = remap(item)
+                return copied
+            if isinstance(value, DictionaryObject):
+                copied = DictionaryObject()
+                for key, item in value.items():
+                    copied[key] = remap(item)
+                return copied
+            if isinstance(value, ArrayObject):
+                return ArrayObject(remap(item) for item in value)
+            return value
+
+        # Number the pages first so links and annotations that point at a
+        # page reuse it instead of dragging in the source page tree.
+        pages = list(reader.pages)
+        page_numbers = []
+        for page in pages:
+            reference = page.indirect_reference
+            numbers[(reference.idnum, reference.generation)] = self._reserve()
+
+        for page in pages:
+            reference = page.indirect_reference
+            copied = DictionaryObject()
+            for key, item in page.items():
+                if key != '/Parent':
+                    copied[key] = remap(item)
+            parent = page.get('/Parent')
+            while parent is not None:
+                parent = parent.get_object()
+                for key in INHERITED_PAGE_KEYS:
+                    if key not in copied and key in parent:
+                        copied[NameObject(key)] = remap(parent[key])
+                parent = parent.get('/Parent')
+            copied[NameObject('/Parent')] = _ref(self.pages_number)
+
+            number = numbers[(reference.idnum, reference.generation)]
+            self._write_object(number, copied)
+            page_numbers.append(number)
+
+            while pending:
+                source = pending.popleft()
+                self._write_object(numbers[(source.idnum, source.generation)], remap(source.get_object()))
+
+        # Publish the pages only once the whole resume was copied, so a PDF that
+        # fails partway leaves unreferenced objects behind instead of broken pages.
+        self.page_numbers.extend(page_numbers)
+        if page_numbers:
+            self.outline.append((title, page_numbers[0]))
+        return len(page_numbers)
+
+    def _write_outline(self):
+        root_number = self._reserve()
+        item_numbers = [self._reserve() for _ in self.outline]
+        for index, (title, page_number) in enumerate(self.outline):
+            item = DictionaryObject({
+                NameObject('/Title'): create_string_object(title),
+                NameObject('/Parent'): _ref(root_number),
+                NameObject('/Dest'): ArrayObject([_ref(page_number), NameObject('/Fit')]),
+            })
+            if index > 0:
+                item[NameObject('/Prev')] = _ref(item_numbers[index - 1])
+            if index < len(item_numbers) - 1:
+                item[NameObject('/Next')] = _ref(item_numbers[index + 1])
+            self._write_object(item_numbers[index], item)
+        self._write_object(root_number, DictionaryObject({
+            NameObject('/Type'): NameObject('/Outlines'),
+            NameObject('/First'): _ref(item_numbers[0]),
+            NameObject('/Last'): _ref(item_numbers[-1]),
+            NameObject('/Count'): NumberObject(len(item_numbers)),
+        }))
+        return root_number
+
+    def close(self):
+        """Write the page tree, outline, catalog, xref table and trailer."""
+        self._write_object(self.pages_number, DictionaryObject({
+            NameObject('/Type'): NameObject('/Pages'),
+            NameObject('/Kids'): ArrayObject(_ref(number) for number in self.page_numbers),
+            NameObject('/Count'): NumberObject(len(self.page_numbers)),
+        }))
+
+        catalog = DictionaryObject({
+            NameObject('/Type'): NameObject('/Catalog'),
+            NameObject('/Pages'): _ref(self.pages_number),
+        })
+        if self.outline:
+            catalog[NameObject('/Outlines')] = _ref(self._write_outline())
+            catalog[NameObject('/PageMode')] = NameObject('/UseOutlines')
+        catalog_number = self._reserve()
+        self._write_object(catalog_number, catalog)
+
+        xref_offset = self.file.tell()
+        self.file.write(f"xref\n0 {len(self.offsets)}\n".encode('ascii'))
+        self.file.write(b"0000000000 65535 f \n")
+        for offset in self.offsets[1:]:
+            # Objects reserved by a resume that failed midway are left free.
+            entry = f"{offset:010d} 00000 n \n" if offset is not None else "0000000000 00000 f \n"
+            self.file.write(entry.encode('ascii'))
+        self.file.write(b"trailer\n")
+        DictionaryObject({
+            NameObject('/Size'): NumberObject(len(self.offsets)),
+            NameObject('/Root'): _ref(catalog_number),
+        }).write_to_stream(self.file)
+        self.file.write(f"\nstartxref\n{xref_offset}\n%%EOF\n".encode('ascii'))
+
+
+def candidate_title(resume_data, index):
+    """Bookmark title for a resume: its name, else its contact name, else its position."""
+    name = resume_data.get('name') or (resume_data.get('contact') or {}).get('name')
+    return str(name) if name else f"Resume {index}"
+
+
+def build_booklet(resumes, output_path, project_root, backend='html', workers=None):
+    """Render every resume and append it to ``output_path``. Returns a stats dictionary.
+
+    At most ``workers`` resumes are being rendered or waiting to be appended
+    at any time, so memory and scratch space stay bounded. The booklet is
+    written to ``<output_path>.partial`` and only renamed into place once it
+    is complete, so a failed run never leaves a truncated booklet behind.
+    """
+    render = RENDERERS[backend]
+    workers = workers or os.cpu_count() or 1
+
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(output_dir, exist_ok=True)
+    partial_path = f"{output_path}.partial"
+
+    try:
+        stats = _write_booklet(resumes, partial_path, output_dir, project_root, render, workers)
+        os.replace(partial_path, output_path)
+    finally:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+    return stats
+
+
+def _write_booklet(resumes, booklet_path, output_dir, project_root, render, workers):
+    stats = {'candidates': 0, 'pages': 0, 'errors': 0}
+    with tempfile.TemporaryDirectory(prefix='booklet-', dir=output_dir) as scratch_dir, \
+            open(booklet_path, 'wb') as file, \
+            ProcessPoolExecutor(max_workers=workers) as executor:
+        writer = BookletWriter(file)
+        in_flight = deque()
+
+        def append_oldest():
+            base_name, title, work_dir, future = in_flight.popleft()
+            try:
+                pdf_path = future.result()
+                stats['pages'] += writer.append_pdf(pdf_path, title)
+                stats['candidates'] += 1
+            except Exception as e:
+                print(f"Error adding {base_name} to the booklet: {e}")
+                stats['errors'] += 1
+            finally:
+                shutil.rmtree(work_dir, ignore_errors=True)
+
+        for index, resume_data in enumerate(resumes, start=1):
+            base_name = f"{index:05d}-{slugify(resume_data.get('name', 'resume'))}"
+            work_dir = os.path.join(scratch_dir, base_name)
+            os.makedirs(work_dir)
+            future = executor.submit(render, resume_data, work_dir, base_name, project_root)
+            in_flight.append((base_name, candidate_title(resume_data, index), work_dir, future))
+            # Append in input order; never hold more than `workers` rendered resumes.
+            if len(in_flight) >= workers:
+                append_oldest()
+        while in_flight:
+            append_oldest()
+
+        writer.close()
+    return stats
+
+
+def main(argv=None):
+    project_root = os.path.dirname(os.path.abspath(__file__))
+
+    parser = argparse.ArgumentParser(description="Render many resumes into one PDF booklet with a bookmark per candidate.")
+    parser.add_argument('input', nargs='?', default=os.path.join(project_root, 'resume.yaml'),
+                        help="Resume YAML (single or multi-document) or JSON Lines file, or '-' for stdin")
+    parser.add_argument('--input-type', choices=('yaml', 'jsonl'))
+    parser.add_argument('--backend', choices=BACKENDS, default='html',
+                        help="Render with WeasyPrint (html) or pdflatex (latex) (default: html)")
+    parser.add_argument('-o', '--output', default=os.path.join(project_root, 'output', 'booklet.pdf'))
+    parser.add_argument('--workers', type=int, default=None, help="Concurrent renders (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    read = {'count': 0}
+
+    def resumes():
+        for resume_data in iter_resumes(args.input, args.input_type):
+            read['count'] += 1
+            yield resume_data
+
+    start = time.perf_counter()
+    try:
+        stats = build_booklet(resumes(), args.output, project_root, backend=args.backend, workers=args.workers)
+    except FileNotFoundError:
+        print(f"Error: The file {args.input} was not found.")
+        return 1
+    except yaml.YAMLError as e:
+        print(f"Error parsing YAML stream after {read['count']} resumes: {e}")
+        return 1
+    elapsed = time.perf_counter() - start
+
+    print(f"Wrote {stats['candidates']} resumes ({stats['pages']} pages) to {args.output}, "
+          f"errors {stats['errors']} in {elapsed:.1f}s")
+    return 1 if stats['errors'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,7 @@ Generate a GitHub-formatted README.md from resume.yaml
 
 import yaml
 import os
+from collections.abc import Mapping
 from datetime import datetime
 
 def load_yaml_data(file_path):
@@ -132,7 +133,7 @@ def generate_markdown(resume_data):
             md.append(f"\n### {category.replace('_', ' ').title()}")
 
             # Check if skills is a list of dictionaries with name and rating
-            if isinstance(skills, list) and skills and isinstance(skills[0], dict) and 'name' in skills[0]:
+            if isinstance(skills, list) and skills and isinstance(skills[0], Mapping) and 'name' in skills[0]:
                 # Sort by rating (descending) then by name
                 sorted_skills = sorted(skills, key=lambda x: (-x.get('rating', 0), x['name']))
 
@@ -148,7 +149,7 @@ def generate_markdown(resume_data):
             else:
                 # Simple list of skills
                 for skill in skills:
-                    if isinstance(skill, dict) and 'name' in skill:
+                    if isinstance(skill, Mapping) and 'name' in skill:
                         md.append(f"- {skill['name']}")
                     else:
                         md.append(f"- {skill}")
@@ -1,9 +1,12 @@
 import yaml
+from collections.abc import Mapping
 from pylatex import Document, Section, Subsection, Command, Package, MiniPage, LineBreak
 from pylatex.utils import italic, bold, NoEscape
 from pylatex.lists import Itemize
 from pylatex.table import Tabular
 
+from latex_driver import build_pdf
+
 # Helper function to sanitize text for LaTeX
 def sanitize_latex_text(text):
     if not isinstance(text, str):
@@ -27,23 +30,60 @@ def sanitize_latex_text(text):
         text = text.replace(old, new)
     return text
 
+# Dots used by the skillrating macro. get_rating_dots() falls back to expanding
+# these inline for scales other than RATING_SCALE.
+RATING_SCALE = 5
+FILLED_DOT_TEX = r"{\color{themecolor} \normalsize \faIcon[solid]{circle}}\hspace{0.1em}"
+EMPTY_DOT_TEX = r"{\color{lightgray} \normalsize \faIcon[regular]{circle}}\hspace{0.1em}"
+
+def _skill_rating_macro():
+    """Builds the skillrating macro: one ifcase branch per possible rating on RATING_SCALE."""
+    cases = [r"\ratingfull" * n + r"\ratingempty" * (RATING_SCALE - n) for n in range(RATING_SCALE + 1)]
+    return r"\newcommand{\skillrating}[1]{\ifcase#1 " + r"\or ".join(cases) + r"\fi}"
+
+# Preamble macros for constructs repeated throughout the body. Emitting short
+# calls to these keeps the .tex small and saves TeX re-reading the same tokens.
+LATEX_MACROS = [
+    r"\newcommand{\ratingfull}{" + FILLED_DOT_TEX + r"}",
+    r"\newcommand{\ratingempty}{" + EMPTY_DOT_TEX + r"}",
+    _skill_rating_macro(),
+    r"\newcommand{\contactlink}[3]{#1\enspace \href{#2}{\color{darkgray}#3}}",
+    r"\newcommand{\linkpill}[3]{\mbox{#1\enspace \href{#2}{#3}}}",
+    r"\newcommand{\appstorelink}[1]{\href{#1}{\faApple\enspace App Store}}",
+    r"\newcommand{\iconlink}[3]{\href{#2}{#1#3}}",
+]
+
+def macro_url(url):
+    """Escapes a URL for use inside a macro argument, where href cannot handle a raw # or %."""
+    return url.replace('%', r'\%').replace('#', r'\#')
+
+def contact_link_tex(icon, url, text):
+    """Icon, link and grey text for the contact header."""
+    return r"\contactlink{" + icon + "}{" + macro_url(url) + "}{" + text + "}"
+
+def link_pill_tex(icon, url, text):
+    """Unbreakable icon + link used under experience and project entries."""
+    return r"\linkpill{" + icon + "}{" + macro_url(url) + "}{" + text + "}"
+
+def app_store_link_tex(url):
+    """Inline App Store link used in itemized project lists."""
+    return r"\appstorelink{" + macro_url(url) + "}"
+
+def icon_link_tex(icon, url, text):
+    """Inline link whose text is prefixed with an icon."""
+    return r"\iconlink{" + icon + "}{" + macro_url(url) + "}{" + text + "}"
+
 # Helper function to generate rating dots
-def get_rating_dots(rating_value, total_dots=5):
+def get_rating_dots(rating_value, total_dots=RATING_SCALE):
     """Generates LaTeX string for skill rating dots using FontAwesome icons."""
     if not isinstance(rating_value, int) or not (0 <= rating_value <= total_dots):
         # Return empty string or some placeholder for invalid ratings
         return ""
 
-    filled_dot_color = "themecolor"  # Main theme color for filled dots
-    empty_dot_color = "lightgray" # Softer color for empty dots
-    dot_size = r"\normalsize"      # Size of the dots, adjust as needed
-    dot_spacing = r"\hspace{0.1em}" # Spacing between dots
+    if total_dots == RATING_SCALE:
+        return r"\skillrating{" + str(rating_value) + "}"
 
-    # Use aIcon[style]{name} from fontawesome5 package
-    filled_dots_str = (r"{\color{" + filled_dot_color + r"} " + dot_size + r" \faIcon[solid]{circle}}" + dot_spacing) * rating_value
-    empty_dots_str = (r"{\color{" + empty_dot_color + r"} " + dot_size + r" \faIcon[regular]{circle}}" + dot_spacing) * (total_dots - rating_value)
-    
-    return (filled_dots_str + empty_dots_str).strip() # .strip() to remove potential trailing hspace
+    return (FILLED_DOT_TEX * rating_value + EMPTY_DOT_TEX * (total_dots - rating_value)).strip()
 
 def load_resume_data(yaml_file_path):
     """Loads resume data from a YAML file."""
@@ -74,7 +114,7 @@ def add_contact_info(doc, contact):
         # Contact details line
         contact_items_tex = []
         if contact.get('email'):
-            contact_items_tex.append(NoEscape(r"\faEnvelope\enspace \href{mailto:" + contact['email'] + r"}{\color{darkgray}" + sanitize_latex_text(contact['email']) + r"}"))
+            contact_items_tex.append(NoEscape(contact_link_tex(r"\faEnvelope", "mailto:" + contact['email'], sanitize_latex_text(contact['email']))))
         if contact.get('phone'):
             contact_items_tex.append(NoEscape(r"\faPhone\enspace {\color{darkgray}" + sanitize_latex_text(contact['phone']) + r"}"))
         if contact.get('location'):
@@ -91,17 +131,17 @@ def add_contact_info(doc, contact):
             linkedin_url = contact['linkedin']
             if not linkedin_url.startswith('http'):
                 linkedin_url = f"https://linkedin.com/in/{linkedin_url}"
-            web_links_tex.append(NoEscape(r"\faLinkedin\enspace \href{" + linkedin_url + r"}{\color{darkgray}" + sanitize_latex_text(contact['linkedin'].replace('https://linkedin.com/in/','')) + r"}"))
+            web_links_tex.append(NoEscape(contact_link_tex(r"\faLinkedin", linkedin_url, sanitize_latex_text(contact['linkedin'].replace('https://linkedin.com/in/','')))))
         if contact.get('github'):
             github_url = contact['github']
             if not github_url.startswith('http'):
                 github_url = f"https://github.com/{github_url}"
-            web_links_tex.append(NoEscape(r"\faGithub\enspace \href{" + github_url + r"}{\color{darkgray}" + sanitize_latex_text(contact['github'].replace('https://github.com/','')) + r"}"))
+            web_links_tex.append(NoEscape(contact_link_tex(r"\faGithub", github_url, sanitize_latex_text(contact['github'].replace('https://github.com/','')))))
         if contact.get('website'):
             website_url = contact['website']
             if not website_url.startswith('http'):
                  website_url = f"https://{website_url}"
-            web_links_tex.append(NoEscape(r"\faGlobe\enspace \href{" + website_url + r"}{\color{darkgray}" + sanitize_latex_text(contact['website'].replace('https://','')) + r"}"))
+            web_links_tex.append(NoEscape(contact_link_tex(r"\faGlobe", website_url, sanitize_latex_text(contact['website'].replace('https://','')))))
 
         if web_links_tex:
             doc.append(Command('centering'))
@@ -162,7 +202,7 @@ def add_experience_section(doc, experiences, section_title="Experience"):
             link_items_tex = []
             app_store_url_yaml = job.get('app_store_url')
             if app_store_url_yaml:
-                link_items_tex.append(NoEscape(r"\mbox{\faApple\enspace \href{" + app_store_url_yaml + r"}{App Store}}"))
+                link_items_tex.append(NoEscape(link_pill_tex(r"\faApple", app_store_url_yaml, "App Store")))
 
             media_urls_data = job.get('media_urls', [])
             if isinstance(media_urls_data, str):
@@ -184,7 +224,7 @@ def add_experience_section(doc, experiences, section_title="Experience"):
                 except IndexError:
                     link_text = "Media Link"
 
-                link_items_tex.append(NoEscape(r"\mbox{\faLink\enspace \href{" + m_url + r"}{ " + sanitize_latex_text(link_text) + r"}}"))
+                link_items_tex.append(NoEscape(link_pill_tex(r"\faLink", m_url, " " + sanitize_latex_text(link_text))))
 
             if link_items_tex:
                 doc.append(NoEscape(r"\vspace{0.25em}"))
@@ -230,7 +270,7 @@ def add_projects_section(doc, projects, section_title="Personal Projects"):
             link_items_tex = []
             app_store_url_yaml = project.get('app_store_link') # Note: YAML key is app_store_link
             if app_store_url_yaml:
-                link_items_tex.append(NoEscape(r"\mbox{\faApple\enspace \href{" + app_store_url_yaml + r"}{App Store}}"))
+                link_items_tex.append(NoEscape(link_pill_tex(r"\faApple", app_store_url_yaml, "App Store")))
 
             other_links_data = project.get('links', [])
             if isinstance(other_links_data, str): # Should be a list of dicts
@@ -243,7 +283,7 @@ def add_projects_section(doc, projects, section_title="Personal Projects"):
                     # Avoid duplicating app store link if it's also in general links with same URL
                     if app_store_url_yaml and app_store_url_yaml == link_url and sanitize_latex_text(link_title).lower() == 'app store':
                         continue
-                    link_items_tex.append(NoEscape(r"\mbox{\faLink\enspace \href{" + link_url + r"}{ " + link_title + r"}}"))
+                    link_items_tex.append(NoEscape(link_pill_tex(r"\faLink", link_url, " " + link_title)))
 
             if link_items_tex:
                 doc.append(NoEscape(r"\vspace{0.25em}"))
@@ -395,7 +435,7 @@ def add_formatted_contributions_section(doc, contributions, section_title="Open
             link_parts = []
             # Handle App Store link first
             if app_store_url_yaml:
-                link_parts.append(NoEscape(r"\href{" + app_store_url_yaml + r"}{\faApple\enspace App Store}"))
+                link_parts.append(NoEscape(app_store_link_tex(app_store_url_yaml)))
 
             # Handle other links
             for link_item in links_data:
@@ -408,7 +448,7 @@ def add_formatted_contributions_section(doc, contributions, section_title="Open
                     icon = r"\faLink"
                     if "github" in link_url.lower():
                         icon = r"\faGithub"
-                    link_parts.append(r"\href{" + link_url + r"}{" + icon + r" " + link_title + r"}")
+                    link_parts.append(icon_link_tex(icon, link_url, link_title))
             
             if link_parts:
                 item_tex += NoEscape(r" {\small " + ", ".join(link_parts) + r"}")
@@ -444,7 +484,7 @@ def add_skills_section_updated(doc, skills_data):
 
         for skill_item in skills_list_for_category_from_yaml:
             # Ensure skill_item is a dictionary before calling .get()
-            if not isinstance(skill_item, dict):
+            if not isinstance(skill_item, Mapping):
                 print(f"Warning: Expected a dictionary for a skill item in category '{category_yaml_key}', but found {type(skill_item)}. Skipping this item.")
                 continue
             skill_name = skill_item.get('name') 
@@ -547,6 +587,10 @@ def create_latex_resume(data):
     # Set default font to sans-serif (optional, many resumes use serif)
     doc.preamble.append(NoEscape(r'\renewcommand{\familydefault}{\sfdefault}'))
 
+    # Macros for repeated constructs (rating dots, link pills)
+    for macro in LATEX_MACROS:
+        doc.preamble.append(NoEscape(macro))
+
     # --- CONTACT INFORMATION ---
     if 'contact' in data:
         add_contact_info(doc, data['contact'])
@@ -597,8 +641,9 @@ if __name__ == "__main__":
         print(f"Generated {file_name}.tex successfully.")
 
         try:
-            latex_document.generate_pdf(file_name, clean_tex=False, compiler='pdflatex')
-            print(f"Generated {file_name}.pdf successfully.")
+            # Rerun pdflatex only while .aux/.out change, reusing the previous build's aux files
+            pdf_path, passes = build_pdf(f"{file_name}.tex", compiler='pdflatex')
+            print(f"Generated {pdf_path} successfully ({passes} pass{'es' if passes != 1 else ''}).")
         except Exception as e:
             print(f"Could not generate PDF: {e}")
             print("Please ensure you have a LaTeX distribution (like MiKTeX, TeX Live, or MacTeX) installed and in your PATH.")
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Compile resume.yaml into a compact, pre-indexed JSON artifact.
+
+The artifact is what the Swift TUI (and any other consumer) loads instead of
+reparsing YAML at startup. It also keeps Resources/resume.yaml in sync with the
+top-level resume.yaml so both copies never drift.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+
+import yaml
+
+# Bump whenever the artifact layout changes in a way consumers must know about.
+ARTIFACT_FORMAT_VERSION = 1
+
+# Sections in the order they appear in every renderer.
+SECTION_ORDER = [
+    'contact',
+    'profile',
+    'experience',
+    'personal_projects',
+    'open_source_contributions',
+    'skills',
+    'education',
+]
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.\-]*[a-z0-9+#]|[a-z0-9]")
+
+
+def load_yaml_data(file_path):
+    """Load data from a YAML file."""
+    with open(file_path, 'r', encoding='utf-8') as file:
+        return yaml.safe_load(file)
+
+
+def sha256_file(file_path):
+    """Return the hex SHA-256 digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compact_json(value):
+    """Serialize a value as deterministic, whitespace-free JSON.
+
+    Unquoted YAML dates load as datetime.date and are written as ISO strings.
+    """
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(',', ':'), default=str)
+
+
+def tokenize(text):
+    """Split free text into lowercase search tokens."""
+    if text is None:
+        return []
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+def sort_skills(skills_data):
+    """Sort each skill category by rating (descending) then by name, as the renderers do."""
+    sorted_skills = {}
+    for category, skills in (skills_data or {}).items():
+        if not isinstance(skills, list):
+            continue
+        entries = [skill for skill in skills if isinstance(skill, dict) and skill.get('name')]
+        sorted_skills[category] = sorted(
+            entries,
+            key=lambda x: (-x['rating'] if isinstance(x.get('rating'), int) else 0, str(x['name']))
+        )
+    return sorted_skills
+
+
+def collect_section_text(section, value):
+    """Yield (location, text) pairs for every searchable string in a section."""
+    if section == 'profile':
+        paragraphs = value if isinstance(value, list) else [value]
+        for paragraph in paragraphs:
+            yield section, paragraph
+    elif section == 'contact':
+        for key, text in (value or {}).items():
+            yield f"{section}.{key}", text
+    elif section == 'skills':
+        for category, skills in sort_skills(value).items():
+            for skill in skills:
+                yield f"{section}.{category}", skill['name']
+    elif isinstance(value, list):
+        for i, entry in enumerate(value):
+            if not isinstance(entry, dict):
+                continue
+            location = f"{section}.{i}"
+            for key in ('company', 'title', 'location', 'name', 'description', 'institution', 'degree'):
+                if entry.get(key):
+                    yield location, entry[key]
+            for responsibility in entry.get('responsibilities') or []:
+                yield location, responsibility
+            technologies = entry.get('technologies') or []
+            if isinstance(technologies, str):
+                technologies = [technologies]
+            for technology in technologies:
+                yield location, technology
+
+
+def build_search_index(resume_data):
+    """Map every search token to the sorted list of locations it occurs in."""
+    index = {}
+    for section in SECTION_ORDER:
+        if not resume_data.get(section):
+            continue
+        for location, text in collect_section_text(section, resume_data[section]):
+            for token in tokenize(text):
+                index.setdefault(token, set()).add(location)
+    return {token: sorted(locations) for token, locations in sorted(index.items())}
+
+
+def build_artifact(resume_data, source_sha256):
+    """Build the artifact dictionary for the given resume data."""
+    sections = []
+    for section in SECTION_ORDER:
+        value = resume_data.get(section)
+        if not value:
+            continue
+        count = len(value) if isinstance(value, (list, dict)) else 1
+        sections.append({'name': section, 'count': count})
+
+    payload = {
+        'resume': resume_data,
+        'index': {
+            'sections': sections,
+            'skills': sort_skills(resume_data.get('skills')),
+            'tokens': build_search_index(resume_data),
+        },
+    }
+
+    return {
+        'format_version': ARTIFACT_FORMAT_VERSION,
+        'source_sha256': source_sha256,
+        'checksum': hashlib.sha256(compact_json(payload).encode('utf-8')).hexdigest(),
+        **payload,
+    }
+
+
+def verify_artifact(artifact):
+    """Return True if the artifact's checksum matches its payload."""
+    payload = {'resume': artifact.get('resume'), 'index': artifact.get('index')}
+    expected = hashlib.sha256(compact_json(payload).encode('utf-8')).hexdigest()
+    return artifact.get('checksum') == expected
+
+
+def sync_resources_yaml(yaml_path, resources_yaml_path):
+    """Copy resume.yaml over Resources/resume.yaml if they differ. Returns True if copied."""
+    if os.path.exists(resources_yaml_path):
+        # Resources/resume.yaml is normally a symlink to ../resume.yaml
+        if os.path.samefile(yaml_path, resources_yaml_path):
+            return False
+        if sha256_file(yaml_path) == sha256_file(resources_yaml_path):
+            return False
+    os.makedirs(os.path.dirname(resources_yaml_path), exist_ok=True)
+    shutil.copyfile(yaml_path, resources_yaml_path)
+    return True
+
+
+def write_artifact(artifact, artifact_path):
+    """Atomically write the artifact as compact JSON."""
+    tmp_path = artifact_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        file.write(compact_json(artifact))
+        file.write('\n')
+    os.replace(tmp_path, artifact_path)
+
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    yaml_path = os.path.join(script_dir, 'resume.yaml')
+    resources_dir = os.path.join(script_dir, 'Resources')
+    resources_yaml_path = os.path.join(resources_dir, 'resume.yaml')
+    artifact_path = os.path.join(resources_dir, 'resume.json')
+
+    try:
+        resume_data = load_yaml_data(yaml_path)
+    except (OSError, yaml.YAMLError) as e:
+        print(f"Error loading {yaml_path}: {e}")
+        return 1
+
+    if sync_resources_yaml(yaml_path, resources_yaml_path):
+        print(f"Updated {os.path.relpath(resources_yaml_path, script_dir)} from resume.yaml")
+
+    artifact = build_artifact(resume_data, sha256_file(yaml_path))
+    write_artifact(artifact, artifact_path)
+    print(f"Successfully generated {os.path.relpath(artifact_path, script_dir)} "
+          f"(format v{ARTIFACT_FORMAT_VERSION}, checksum {artifact['checksum'][:12]})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
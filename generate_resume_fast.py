@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+"""
+Fast LaTeX backend: writes the same .tex as generate_resume.create_latex_resume()
+straight to a stream, without building a PyLaTeX Document tree.
+
+PyLaTeX joins every object in a container with "%\\n" and nested containers
+flatten into the same sequence, so each section below is just an ordered run
+of fragments. A section appends a blank line after its last fragment (PyLaTeX's
+end_paragraph). The preamble never depends on the resume and is precompiled.
+
+Usage:
+    python generate_resume_fast.py [resume.yaml] [-o resume_generated.tex]
+    python generate_resume_fast.py --check     # compare against the PyLaTeX path
+"""
+
+import argparse
+import io
+import sys
+from collections.abc import Mapping
+
+from generate_resume import (
+    LATEX_MACROS, app_store_link_tex, contact_link_tex, get_rating_dots, icon_link_tex,
+    link_pill_tex, load_resume_data, sanitize_latex_text,
+)
+
+# Everything create_latex_resume() emits up to and including \begin{document}.
+PREAMBLE = (
+    r"\documentclass[10pt]{article}%" "\n"
+    r"\usepackage[T1]{fontenc}%" "\n"
+    r"\usepackage[utf8]{inputenc}%" "\n"
+    r"\usepackage{lmodern}%" "\n"
+    r"\usepackage{textcomp}%" "\n"
+    r"\usepackage{lastpage}%" "\n"
+    r"\usepackage{geometry}%" "\n"
+    r"\geometry{a4paper=True,margin=0.75in}%" "\n"
+    r"\usepackage{hyperref}%" "\n"
+    r"\usepackage{fontawesome5}%" "\n"
+    r"\usepackage{amssymb}%" "\n"
+    r"\usepackage{enumitem}%" "\n"
+    r"\usepackage{titlesec}%" "\n"
+    r"\usepackage[svgnames,x11names]{xcolor}%" "\n"
+    r"\usepackage{array}%" "\n"
+    r"\usepackage{ragged2e}%" "\n"
+    r"\usepackage{setspace}%" "\n"
+    r"\usepackage{needspace}%" "\n"
+    r"\usepackage{helvet}%" "\n"
+    "%\n"
+    r"\definecolor{themecolor}{rgb}{0.15, 0.15, 0.35}%" "\n"
+    r"\definecolor{linkcolor}{rgb}{0.2, 0.4, 0.7}%" "\n"
+    r"\definecolor{lightgray}{rgb}{0.92, 0.92, 0.92}%" "\n"
+    r"\definecolor{mediumgray}{rgb}{0.5, 0.5, 0.5}%" "\n"
+    r"\definecolor{darkgray}{rgb}{0.3, 0.3, 0.3}%" "\n"
+    r"\hypersetup{colorlinks=true, linkcolor=linkcolor, urlcolor=linkcolor, citecolor=linkcolor}%" "\n"
+    r"\pagenumbering{gobble}%" "\n"
+    r"\titleformat{\section}{\Large\scshape\bfseries\color{themecolor}}{}{0em}{}[\color{lightgray}\titlerule]%" "\n"
+    r"\titlespacing*{\section}{0pt}{1.2em}{0.8em}%" "\n"
+    r"\titleformat{\subsection}{\large\bfseries\color{themecolor}}{}{0em}{}%" "\n"
+    r"\titlespacing*{\subsection}{0pt}{1em}{0.5em}%" "\n"
+    r"\renewcommand{\familydefault}{\sfdefault}%" "\n"
+    + "".join(macro + "%\n" for macro in LATEX_MACROS)
+    + "%\n"
+    r"\begin{document}"
+)
+
+DOCUMENT_END = r"\end{document}"
+
+SEPARATOR = " \\quad | \\quad "
+EXPERIENCE_ITEMIZE_BEGIN = r"\begin{itemize}[leftmargin=1.5em, label=\textbullet, nosep, topsep=0.2em, itemsep=0.15em]"
+CONTRIBUTIONS_ITEMIZE_BEGIN = r"\begin{itemize}[leftmargin=*, itemsep=0.3em, topsep=0.3em, parsep=0.1em]"
+SKILLS_TABULAR_BEGIN = r"\begin{tabular}{@{}>{\RaggedRight}p{3.5cm}@{}>{\RaggedLeft}p{3cm}@{}}"
+
+
+class TexWriter:
+    """Writes fragments to a stream, separated by "%\\n" as PyLaTeX does."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def emit(self, fragment):
+        self.stream.write("%\n")
+        self.stream.write(fragment)
+
+    def begin_section(self, title):
+        self.emit(r"\section*{" + title + "}")
+        self.emit(r"\label{sec:" + title.replace(' ', '') + "}")
+
+    def end_section(self):
+        self.stream.write("\n\n")
+
+
+def write_contact_info(out, contact):
+    """Writes the contact header minipage."""
+    if not contact:
+        return
+
+    out.emit(r"\begin{minipage}{\textwidth}")
+    if contact.get('name'):
+        out.emit(r"\centering")
+        out.emit(r"{\Huge\bfseries\color{themecolor} " + sanitize_latex_text(contact['name']) + r"}\par")
+        out.emit(r"\vspace{0.2em}")
+
+    contact_items_tex = []
+    if contact.get('email'):
+        contact_items_tex.append(contact_link_tex(r"\faEnvelope", "mailto:" + contact['email'], sanitize_latex_text(contact['email'])))
+    if contact.get('phone'):
+        contact_items_tex.append(r"\faPhone\enspace {\color{darkgray}" + sanitize_latex_text(contact['phone']) + r"}")
+    if contact.get('location'):
+        contact_items_tex.append(r"\faMapMarkerAlt\enspace {\color{darkgray}" + sanitize_latex_text(contact['location']) + r"}")
+
+    out.emit(r"\centering")
+    out.emit(r' ~|~ '.join(contact_items_tex) + r"\par")
+    out.emit(r"\vspace{0.1em}")
+
+    web_links_tex = []
+    if contact.get('linkedin'):
+        linkedin_url = contact['linkedin']
+        if not linkedin_url.startswith('http'):
+            linkedin_url = f"https://linkedin.com/in/{linkedin_url}"
+        web_links_tex.append(contact_link_tex(r"\faLinkedin", linkedin_url, sanitize_latex_text(contact['linkedin'].replace('https://linkedin.com/in/', ''))))
+    if contact.get('github'):
+        github_url = contact['github']
+        if not github_url.startswith('http'):
+            github_url = f"https://github.com/{github_url}"
+        web_links_tex.append(contact_link_tex(r"\faGithub", github_url, sanitize_latex_text(contact['github'].replace('https://github.com/', ''))))
+    if contact.get('website'):
+        website_url = contact['website']
+        if not website_url.startswith('http'):
+            website_url = f"https://{website_url}"
+        web_links_tex.append(contact_link_tex(r"\faGlobe", website_url, sanitize_latex_text(contact['website'].replace('https://', ''))))
+
+    if web_links_tex:
+        out.emit(r"\centering")
+        out.emit(SEPARATOR.join(web_links_tex) + r"\par")
+
+    out.emit(r"\vspace{1em}")
+    out.emit(r"\end{minipage}")
+
+
+def write_profile_section(out, profile_text):
+    """Writes the profile section."""
+    out.begin_section("Profile")
+    if isinstance(profile_text, list):
+        processed_items = [sanitize_latex_text(item).replace('\n', r'\newline ') for item in profile_text]
+        processed_profile_text = r"\newline ".join(processed_items)
+    elif isinstance(profile_text, str):
+        processed_profile_text = sanitize_latex_text(profile_text).replace('\n', r'\newline ')
+    else:
+        processed_profile_text = "Profile data is not in expected format (string or list)."
+        print(f"Warning: Profile data type was {type(profile_text)}, expected str or list.")
+    out.emit(processed_profile_text)
+    out.end_section()
+
+
+def media_link_text(m_url):
+    """Short link text for a media URL, matching add_experience_section()."""
+    try:
+        domain_parts = m_url.split('//')[-1].split('/')
+        domain = domain_parts[0].replace('www.', '')
+        link_text = domain
+        if 'github.com' in domain: link_text = f"GitHub: {domain_parts[1] if len(domain_parts) > 1 else domain}"
+        elif 'techcrunch.com' in domain: link_text = "TechCrunch"
+        elif 'venturebeat.com' in domain: link_text = "VentureBeat"
+    except IndexError:
+        link_text = "Media Link"
+    return link_text
+
+
+def write_experience_section(out, experiences, section_title="Experience"):
+    """Writes a chronological experience section."""
+    if not experiences:
+        return
+
+    out.begin_section(section_title)
+    for i, job in enumerate(experiences):
+        out.emit(r"\Needspace{12\baselineskip}")
+
+        title = sanitize_latex_text(job.get('title', ''))
+        company = sanitize_latex_text(job.get('company', ''))
+        location = sanitize_latex_text(job.get('location', ''))
+        start_date = sanitize_latex_text(job.get('start_date', ''))
+        end_date = sanitize_latex_text(job.get('end_date') if job.get('end_date') else 'Present')
+
+        if title:
+            out.emit(r"{\large\bfseries\color{themecolor} " + title + r"}\par")
+            out.emit(r"\vspace{0.05em}")
+
+        header_parts = []
+        if company:
+            header_parts.append(r"{\bfseries " + company + r"}")
+        if location:
+            header_parts.append(r"{\itshape " + location + r"}")
+
+        date_string = r"{\small\itshape\color{mediumgray} " + start_date + " – " + end_date + r"}"
+        if header_parts:
+            out.emit(SEPARATOR.join(header_parts) + r" \hfill " + date_string + r"\par")
+        else:
+            out.emit(r"\hfill " + date_string + r"\par")
+
+        link_items_tex = []
+        app_store_url_yaml = job.get('app_store_url')
+        if app_store_url_yaml:
+            link_items_tex.append(link_pill_tex(r"\faApple", app_store_url_yaml, "App Store"))
+
+        media_urls_data = job.get('media_urls', [])
+        if isinstance(media_urls_data, str):
+            media_urls_data = [media_urls_data]
+        for m_url in media_urls_data:
+            if app_store_url_yaml and app_store_url_yaml == m_url:
+                continue
+            link_items_tex.append(link_pill_tex(r"\faLink", m_url, " " + sanitize_latex_text(media_link_text(m_url))))
+
+        if link_items_tex:
+            out.emit(r"\vspace{0.25em}")
+            out.emit(r"{\small " + SEPARATOR.join(link_items_tex) + r"}\par")
+
+        responsibilities = job.get('responsibilities', [])
+        if responsibilities:
+            out.emit(r"\vspace{0.3em}")
+            items = []
+            for resp_item in responsibilities:
+                if isinstance(resp_item, str):
+                    items.append(sanitize_latex_text(resp_item).replace('\n', r'\newline '))
+                else:
+                    print(f"Warning: Responsibility item in 'experience' section expected string, got {type(resp_item)}: {resp_item}. Skipping this item.")
+            if items:
+                out.emit(EXPERIENCE_ITEMIZE_BEGIN)
+                for item in items:
+                    out.emit(r"\item")
+                    out.emit(item)
+                out.emit(r"\end{itemize}")
+            else:
+                # PyLaTeX omits an empty list but still separates the empty slot.
+                out.emit("")
+
+        if i < len(experiences) - 1:
+            out.emit(r"\vspace{1em}")
+    out.end_section()
+
+
+def write_formatted_contributions_section(out, contributions, section_title="Open Source Contributions"):
+    """Writes a compact itemized section for contributions or personal projects."""
+    if not contributions:
+        return
+
+    out.emit(r"\Needspace{10\baselineskip}")
+    out.begin_section(section_title)
+    out.emit(CONTRIBUTIONS_ITEMIZE_BEGIN)
+
+    for contrib_or_project in contributions:
+        name = sanitize_latex_text(contrib_or_project.get('name', ''))
+        description = contrib_or_project.get('description', '')
+        links_data = contrib_or_project.get('links', [])
+        if isinstance(links_data, str): links_data = []
+        app_store_url_yaml = contrib_or_project.get('app_store_link')
+
+        item_tex = r"\item "
+        if name:
+            item_tex += r"{\bfseries " + name + r"} "
+        if description:
+            item_tex += r"-- " + sanitize_latex_text(description).split('\n')[0]
+
+        link_parts = []
+        if app_store_url_yaml:
+            link_parts.append(app_store_link_tex(app_store_url_yaml))
+        for link_item in links_data:
+            link_title = sanitize_latex_text(link_item.get('title', 'Link'))
+            link_url = link_item.get('url')
+            if link_url:
+                if app_store_url_yaml and app_store_url_yaml == link_url and link_title.lower() == 'app store':
+                    continue
+                icon = r"\faLink"
+                if "github" in link_url.lower():
+                    icon = r"\faGithub"
+                link_parts.append(icon_link_tex(icon, link_url, link_title))
+
+        if link_parts:
+            item_tex += r" {\small " + ", ".join(link_parts) + r"}"
+
+        out.emit(item_tex)
+
+    out.emit(r"\end{itemize}")
+    out.end_section()
+
+
+def organize_skills(skills_data):
+    """Group skills by display category, sorted by rating then name, as add_skills_section_updated() does."""
+    organized_skills = {}
+    for category_yaml_key, skills_list in skills_data.items():
+        display_category_title = category_yaml_key.replace('_', ' ').title()
+        if category_yaml_key == "sdks_apis":
+            display_category_title = "SDKs & APIs"
+        if display_category_title not in organized_skills:
+            organized_skills[display_category_title] = []
+
+        if not isinstance(skills_list, list):
+            print(f"Warning: Expected a list of skills for category '{category_yaml_key}', but found {type(skills_list)}. Skipping this category.")
+            continue
+
+        for skill_item in skills_list:
+            if not isinstance(skill_item, Mapping):
+                print(f"Warning: Expected a dictionary for a skill item in category '{category_yaml_key}', but found {type(skill_item)}. Skipping this item.")
+                continue
+            skill_name = skill_item.get('name')
+            rating = skill_item.get('rating')
+            if skill_name:
+                organized_skills[display_category_title].append((skill_name, rating))
+
+    for category_title_key in organized_skills:
+        organized_skills[category_title_key].sort(key=lambda x: (-x[1] if isinstance(x[1], int) else 0, str(x[0])))
+    return organized_skills
+
+
+def write_skills_section(out, skills_data):
+    """Writes the skills table."""
+    if not skills_data:
+        return
+
+    organized_skills = organize_skills(skills_data)
+
+    out.begin_section("Skills")
+    out.emit(r"\vspace{-1.5em}")
+
+    rows = []
+    first_category_processed = False
+    for category_title in sorted(organized_skills.keys()):
+        skills_list_for_category = organized_skills[category_title]
+        if not skills_list_for_category:
+            continue
+        if first_category_processed:
+            rows.append(r"\noalign{\vspace{0.6em}}")
+        rows.append(r"\multicolumn{2}{@{}l@{}}{\textbf{" + sanitize_latex_text(category_title) + r"}} \\ ")
+        rows.append(r"\noalign{\vspace{0.2em}}")
+        for skill_name, rating in skills_list_for_category:
+            if not skill_name:
+                continue
+            rows.append(f"{sanitize_latex_text(skill_name)} & {get_rating_dots(rating)} \\")
+        first_category_processed = True
+
+    if rows:
+        out.emit(SKILLS_TABULAR_BEGIN)
+        out.emit("\n".join(rows))
+        out.emit(r"\end{tabular}")
+    out.end_section()
+
+
+def write_education_section(out, education_data):
+    """Writes the education section."""
+    if not education_data:
+        return
+
+    out.begin_section("Education")
+    for i, edu_item in enumerate(education_data):
+        out.emit(r"\Needspace{6\baselineskip}")
+
+        institution = sanitize_latex_text(edu_item.get('institution', ''))
+        degree = sanitize_latex_text(edu_item.get('degree', ''))
+        major = sanitize_latex_text(edu_item.get('major'))
+        grad_date = sanitize_latex_text(edu_item.get('graduation_date', ''))
+
+        if institution:
+            out.emit(r"{\large\bfseries\color{themecolor} " + institution + r"}\par")
+            out.emit(r"\vspace{0.1em}")
+
+        degree_major_parts = []
+        if degree:
+            degree_major_parts.append(r"{\bfseries " + degree + r"}")
+        if major:
+            degree_major_parts.append(major)
+        degree_major_str = ", ".join(degree_major_parts)
+
+        date_str = ""
+        if grad_date:
+            date_str = r"{\small\itshape\color{mediumgray} " + grad_date + r"}"
+
+        if degree_major_str and date_str:
+            out.emit(degree_major_str + r" \hfill " + date_str + r"\par")
+        elif degree_major_str:
+            out.emit(degree_major_str + r"\par")
+        elif date_str:
+            out.emit(r"\hfill " + date_str + r"\par")
+
+        if degree_major_str or date_str:
+            out.emit(r"\vspace{0.2em}")
+
+        if i < len(education_data) - 1:
+            out.emit(r"\vspace{0.8em}")
+    out.end_section()
+
+
+def write_latex_resume(data, stream):
+    """Writes the complete .tex for ``data`` to a text stream."""
+    stream.write(PREAMBLE)
+    out = TexWriter(stream)
+    out.emit(r"\normalsize")
+
+    if 'contact' in data:
+        write_contact_info(out, data['contact'])
+    else:
+        print("Warning: 'contact' not found in YAML data.")
+
+    if 'profile' in data and data['profile']:
+        write_profile_section(out, data['profile'])
+    else:
+        print("Warning: 'profile' text not found in YAML data.")
+
+    if 'experience' in data and data['experience']:
+        write_experience_section(out, data['experience'], section_title="Experience")
+    else:
+        print("Warning: 'experience' data not found in YAML.")
+
+    if 'personal_projects' in data and data['personal_projects']:
+        write_formatted_contributions_section(out, data['personal_projects'], section_title="Personal Projects")
+
+    if 'open_source_contributions' in data and data['open_source_contributions']:
+        write_formatted_contributions_section(out, data['open_source_contributions'], section_title="Open Source Contributions")
+
+    if 'skills' in data and data['skills']:
+        write_skills_section(out, data['skills'])
+
+    if 'education' in data and data['education']:
+        write_education_section(out, data['education'])
+
+    out.emit(DOCUMENT_END)
+
+
+def create_latex_source(data):
+    """Returns the complete .tex for ``data`` as a string."""
+    buffer = io.StringIO()
+    write_latex_resume(data, buffer)
+    return buffer.getvalue()
+
+
+def check_against_pylatex(data):
+    """Returns True if the fast backend matches create_latex_resume(data).dumps() byte for byte."""
+    from generate_resume import create_latex_resume
+
+    expected = create_latex_resume(data).dumps()
+    actual = create_latex_source(data)
+    if actual == expected:
+        return True
+
+    mismatch = next((i for i, (a, b) in enumerate(zip(actual, expected)) if a != b), min(len(actual), len(expected)))
+    print(f"Mismatch at offset {mismatch}:")
+    print(f"  PyLaTeX: {expected[max(0, mismatch - 80):mismatch + 80]!r}")
+    print(f"  fast:    {actual[max(0, mismatch - 80):mismatch + 80]!r}")
+    return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write the LaTeX resume without building a PyLaTeX document.")
+    parser.add_argument('yaml_file', nargs='?', default='resume.yaml')
+    parser.add_argument('-o', '--output', default='resume_generated.tex')
+    parser.add_argument('--check', action='store_true', help="Verify the output is byte-identical to the PyLaTeX backend")
+    args = parser.parse_args(argv)
+
+    resume_data = load_resume_data(args.yaml_file)
+    if not resume_data:
+        print(f"Could not generate resume. Please check {args.yaml_file}.")
+        return 1
+
+    if args.check:
+        if check_against_pylatex(resume_data):
+            print("Fast backend output is byte-identical to the PyLaTeX backend.")
+            return 0
+        return 1
+
+    with open(args.output, 'w', encoding='utf-8') as file:
+        write_latex_resume(resume_data, file)
+    print(f"Generated {args.output} successfully.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
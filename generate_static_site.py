@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Export rendered HTML resumes as a precompressed static site.
+
+Every resume becomes <slug>/index.html. Files from static/ are copied once
+into assets/ under content-hashed names (style.3f2a9c1b.css), so they can be
+cached forever and a changed stylesheet always gets a new URL. The CSS rules a
+page actually uses on screen are inlined into its <head>, and the full
+stylesheet is loaded without blocking rendering. Remote stylesheets the
+template links (Google Fonts, Font Awesome) are downloaded at export time,
+together with the fonts they reference, and served from assets/ as well; if
+one cannot be fetched (e.g. offline) the page keeps its remote link and a
+warning is printed. Each file gets precompressed .gz and, when the brotli
+module is installed, .br siblings so the web server can serve them as-is
+(nginx gzip_static / brotli_static).
+
+Usage:
+    python generate_static_site.py resume.yaml -o output/site
+    python generate_static_site.py batch.yaml batch2.jsonl -o output/site
+    python generate_static_site.py resume.yaml --keep-remote-assets
+"""
+
+import argparse
+import gzip
+import hashlib
+import os
+import posixpath
+import re
+import sys
+import urllib.parse
+import urllib.request
+
+import yaml
+
+from resume_stream import iter_resumes, load_html_template, slugify
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+FINGERPRINT_LENGTH = 8
+ASSETS_DIR = 'assets'
+
+CLASS_ATTR_PATTERN = re.compile(r'class="([^"]*)"')
+SELECTOR_CLASS_PATTERN = re.compile(r'\.([A-Za-z_-][\w-]*)')
+CSS_COMMENT_PATTERN = re.compile(r'/\*.*?\*/', re.S)
+LINK_TAG_PATTERN = re.compile(r'<link\b[^>]*>')
+HREF_PATTERN = re.compile(r'\bhref="(https?://[^"]+)"')
+CSS_URL_PATTERN = re.compile(r'url\(\s*([\'"]?)([^\'")]+)\1\s*\)')
+
+# Google Fonts only serves woff2 to browsers it recognises.
+FETCH_USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36'
+FETCH_TIMEOUT = 30
+
+
+def fingerprint_name(file_name, content):
+    """style.css + content -> style.<hash>.css"""
+    digest = hashlib.sha256(content).hexdigest()[:FINGERPRINT_LENGTH]
+    base, extension = os.path.splitext(file_name)
+    return f"{base}.{digest}{extension}"
+
+
+def split_css_rules(css):
+    """Split a stylesheet into top-level (prelude, block) pairs, keeping @-blocks whole."""
+    css = CSS_COMMENT_PATTERN.sub('', css)
+    rules = []
+    depth = 0
+    start = 0
+    prelude_end = None
+    for i, char in enumerate(css):
+        if char == '{':
+            if depth == 0:
+                prelude_end = i
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                rules.append((css[start:prelude_end].strip(), css[prelude_end:i + 1]))
+                start = i + 1
+    return rules
+
+
+def critical_css(css, html):
+    """Return the screen rules from ``css`` whose selectors can match classes used in ``html``.
+
+    @-rules (print styles, @page, ...) are left to the full stylesheet.
+    """
+    used_classes = set()
+    for class_attr in CLASS_ATTR_PATTERN.findall(html):
+        used_classes.update(class_attr.split())
+
+    critical = []
+    for prelude, block in split_css_rules(css):
+        if not prelude or prelude.startswith('@'):
+            continue
+        selectors = [selector.strip() for selector in prelude.split(',')]
+        kept = [selector for selector in selectors
+                if set(SELECTOR_CLASS_PATTERN.findall(selector)) <= used_classes]
+        if kept:
+            critical.append(','.join(kept) + re.sub(r'\s+', ' ', block))
+    return ''.join(critical)
+
+
+def write_precompressed(path, content):
+    """Write a file plus .gz (and .br if available) siblings. Returns the paths written."""
+    written = [path]
+    with open(path, 'wb') as file:
+        file.write(content)
+    with open(path + '.gz', 'wb') as file:
+        # mtime=0 keeps the .gz byte-identical across exports of the same content.
+        file.write(gzip.compress(content, compresslevel=9, mtime=0))
+    written.append(path + '.gz')
+    if brotli is not None:
+        with open(path + '.br', 'wb') as file:
+            file.write(brotli.compress(content, quality=11))
+        written.append(path + '.br')
+    return written
+
+
+def write_asset(output_dir, file_name, content):
+    """Write ``content`` into assets/ under its fingerprinted name. Returns 'assets/<name>'."""
+    hashed_path = f"{ASSETS_DIR}/{fingerprint_name(file_name, content)}"
+    target_path = os.path.join(output_dir, *hashed_path.split('/'))
+    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+    if not os.path.exists(target_path):
+        write_precompressed(target_path, content)
+    return hashed_path
+
+
+def fetch_url(url):
+    request = urllib.request.Request(url, headers={'User-Agent': FETCH_USER_AGENT})
+    with urllib.request.urlopen(request, timeout=FETCH_TIMEOUT) as response:
+        return response.read()
+
+
+class RemoteAssets:
+    """Downloads remote stylesheets, and the files they reference, into assets/ once per export."""
+
+    def __init__(self, output_dir, fetch=fetch_url):
+        self.output_dir = output_dir
+        self.fetch = fetch
+        self.stylesheets = {}
+        self.files = {}
+
+    def stylesheet(self, url):
+        """Return the assets/ path for a remote stylesheet, or None if it could not be vendored."""
+        if url not in self.stylesheets:
+            try:
+                self.stylesheets[url] = self._vendor_stylesheet(url)
+            except (OSError, ValueError) as e:
+                print(f"Warning: Could not download {url} ({e}). Pages will keep the remote link.")
+                self.stylesheets[url] = None
+        return self.stylesheets[url]
+
+    def _vendor_stylesheet(self, url):
+        def local_url(match):
+            reference = match.group(2).strip()
+            if reference.startswith(('data:', '#')):
+                return match.group(0)
+            asset_url, _fragment = urllib.parse.urldefrag(urllib.parse.urljoin(url, reference))
+            # Stylesheet and fonts all live in assets/, so a bare file name resolves.
+            return f'url("{posixpath.basename(self._vendor_file(asset_url))}")'
+
+        css = CSS_URL_PATTERN.sub(local_url, self.fetch(url).decode('utf-8'))
+        return write_asset(self.output_dir, remote_file_name(url, '.css'), css.encode('utf-8'))
+
+    def _vendor_file(self, url):
+        if url not in self.files:
+            self.files[url] = write_asset(self.output_dir, remote_file_name(url), self.fetch(url))
+        return self.files[url]
+
+
+def remote_file_name(url, default_extension=''):
+    """https://host/a/fa-solid-900.woff2?v=1 -> fa-solid-900.woff2; adds ``default_extension`` if none."""
+    name = posixpath.basename(urllib.parse.urlsplit(url).path) or 'asset'
+    if default_extension and not os.path.splitext(name)[1]:
+        name += default_extension
+    return name
+
+
+def export_assets(static_dir, output_dir):
+    """Copy static/ into assets/ with fingerprinted names.
+
+    Returns ({'static/style.css': 'assets/style.<hash>.css', ...}, {original name: bytes}).
+    """
+    assets_dir = os.path.join(output_dir, ASSETS_DIR)
+    os.makedirs(assets_dir, exist_ok=True)
+    mapping = {}
+    contents = {}
+    for root, _dirs, files in os.walk(static_dir):
+        for file_name in sorted(files):
+            source_path = os.path.join(root, file_name)
+            relative_path = os.path.relpath(source_path, static_dir).replace(os.sep, '/')
+            with open(source_path, 'rb') as file:
+                content = file.read()
+            mapping[f"static/{relative_path}"] = write_asset(output_dir, relative_path, content)
+            contents[relative_path] = content
+    return mapping, contents
+
+
+def rewrite_page(html, asset_mapping, stylesheet_css, page_depth=1, remote_assets=None):
+    """Point static/ (and, with ``remote_assets``, remote stylesheet) references at
+    fingerprinted assets and inline the page's critical CSS."""
+    prefix = '../' * page_depth
+
+    if remote_assets is not None:
+        def vendor_link(match):
+            tag = match.group(0)
+            href = HREF_PATTERN.search(tag)
+            if 'stylesheet' not in tag or href is None:
+                return tag
+            local_path = remote_assets.stylesheet(href.group(1))
+            return tag.replace(href.group(0), f'href="{prefix}{local_path}"') if local_path else tag
+
+        html = LINK_TAG_PATTERN.sub(vendor_link, html)
+    stylesheet_href = asset_mapping.get('static/style.css')
+
+    if stylesheet_href:
+        inline = critical_css(stylesheet_css, html)
+        deferred = (
+            f'<style>{inline}</style>\n'
+            f'    <link rel="preload" href="{prefix}{stylesheet_href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+            f'    <noscript><link rel="stylesheet" href="{prefix}{stylesheet_href}"></noscript>'
+        )
+        html = html.replace('<link rel="stylesheet" href="static/style.css">', deferred, 1)
+
+    for original, hashed in asset_mapping.items():
+        html = html.replace(f'"{original}"', f'"{prefix}{hashed}"')
+    return html
+
+
+def export_site(resumes, output_dir, project_root, vendor_remote=True):
+    """Render every resume from an iterable into a static site. Returns the number of pages."""
+    template = load_html_template(project_root)
+
+    asset_mapping, asset_contents = export_assets(os.path.join(project_root, 'static'), output_dir)
+    stylesheet_css = asset_contents.get('style.css', b'').decode('utf-8')
+    remote_assets = RemoteAssets(output_dir) if vendor_remote else None
+
+    used_slugs = set()
+    pages = 0
+    for resume_data in resumes:
+        slug = base_slug = slugify(resume_data.get('name', 'resume'))
+        suffix = 2
+        while slug in used_slugs:
+            slug = f"{base_slug}-{suffix}"
+            suffix += 1
+        used_slugs.add(slug)
+
+        html = rewrite_page(template.render(resume_data=resume_data), asset_mapping, stylesheet_css,
+                            remote_assets=remote_assets)
+        page_dir = os.path.join(output_dir, slug)
+        os.makedirs(page_dir, exist_ok=True)
+        write_precompressed(os.path.join(page_dir, 'index.html'), html.encode('utf-8'))
+        pages += 1
+    return pages
+
+
+def main(argv=None):
+    project_root = os.path.dirname(os.path.abspath(__file__))
+
+    parser = argparse.ArgumentParser(description="Export HTML resumes as a precompressed static site.")
+    parser.add_argument('inputs', nargs='*', default=[os.path.join(project_root, 'resume.yaml')],
+                        help="Resume YAML (single or multi-document) or JSON Lines files (default: resume.yaml)")
+    parser.add_argument('--input-type', choices=('yaml', 'jsonl'))
+    parser.add_argument('-o', '--output-dir', default=os.path.join(project_root, 'output', 'site'))
+    parser.add_argument('--keep-remote-assets', action='store_true',
+                        help="Link Google Fonts and Font Awesome from their CDNs instead of downloading them")
+    args = parser.parse_args(argv)
+
+    read = {'count': 0}
+
+    def resumes():
+        for input_path in args.inputs:
+            for resume_data in iter_resumes(input_path, args.input_type):
+                read['count'] += 1
+                yield resume_data
+
+    try:
+        pages = export_site(resumes(), args.output_dir, project_root, vendor_remote=not args.keep_remote_assets)
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        return 1
+    except yaml.YAMLError as e:
+        print(f"Error parsing YAML stream after {read['count']} resumes: {e}")
+        return 1
+
+    compression = 'gzip + brotli' if brotli is not None else 'gzip'
+    print(f"Successfully exported {pages} pages to {args.output_dir} ({compression} precompressed)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
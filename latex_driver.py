@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Aux-aware LaTeX compile driver.
+
+Instead of running a fixed number of passes, the driver hashes the auxiliary
+files (.aux, .out, .toc, ...) before and after every pass and only reruns when
+a pass changed them. Builds happen in a persistent per-document build
+directory, so the aux files from the previous build of the same document are
+reused and an unchanged resume usually needs a single pass.
+
+Usage:
+    python latex_driver.py resume_generated.tex [--build-dir .latex-build/resume_generated]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+
+LATEX_COMPILER = 'pdflatex'
+LATEX_MAX_PASSES = 4
+
+# Files whose contents feed back into the next pass.
+AUX_EXTENSIONS = ('.aux', '.out', '.toc', '.lof', '.lot', '.nav', '.snm')
+
+
+class LatexError(RuntimeError):
+    """Raised when a compiler pass fails."""
+
+
+def aux_snapshot(build_dir, jobname):
+    """Return {extension: sha256 or None} for every auxiliary file of a job."""
+    snapshot = {}
+    for extension in AUX_EXTENSIONS:
+        path = os.path.join(build_dir, jobname + extension)
+        try:
+            with open(path, 'rb') as file:
+                snapshot[extension] = hashlib.sha256(file.read()).hexdigest()
+        except FileNotFoundError:
+            snapshot[extension] = None
+    return snapshot
+
+
+def clear_aux(build_dir, jobname):
+    """Delete a job's auxiliary files so the next build starts clean."""
+    for extension in AUX_EXTENSIONS:
+        try:
+            os.remove(os.path.join(build_dir, jobname + extension))
+        except FileNotFoundError:
+            pass
+
+
+def compiler_command(compiler, tex_path, build_dir):
+    return [compiler, '-interaction=nonstopmode', '-halt-on-error', f'-output-directory={build_dir}', tex_path]
+
+
+def _prepare(tex_path, build_dir):
+    os.makedirs(build_dir, exist_ok=True)
+    return os.path.splitext(os.path.basename(tex_path))[0]
+
+
+def _check_pass(compiler, returncode, output, build_dir, jobname):
+    if returncode != 0:
+        # A failed pass can leave half-written aux files; never reuse them (as latexmk does).
+        clear_aux(build_dir, jobname)
+        tail = output.decode('utf-8', errors='replace')[-2000:]
+        raise LatexError(f"{compiler} exited with {returncode}:\n{tail}")
+
+
+def compile_latex(tex_path, build_dir, compiler=LATEX_COMPILER, max_passes=LATEX_MAX_PASSES):
+    """Compile until the aux files stop changing. Returns the number of passes run."""
+    jobname = _prepare(tex_path, build_dir)
+    before = aux_snapshot(build_dir, jobname)
+    for passes in range(1, max_passes + 1):
+        result = subprocess.run(compiler_command(compiler, tex_path, build_dir),
+                                stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        _check_pass(compiler, result.returncode, result.stdout, build_dir, jobname)
+        after = aux_snapshot(build_dir, jobname)
+        if after == before:
+            return passes
+        before = after
+    print(f"Warning: {jobname} aux files still changing after {max_passes} passes.")
+    return max_passes
+
+
+async def compile_latex_async(tex_path, build_dir, compiler=LATEX_COMPILER, max_passes=LATEX_MAX_PASSES):
+    """Async version of compile_latex() using asyncio subprocesses."""
+    jobname = _prepare(tex_path, build_dir)
+    before = aux_snapshot(build_dir, jobname)
+    for passes in range(1, max_passes + 1):
+        process = await asyncio.create_subprocess_exec(
+            *compiler_command(compiler, tex_path, build_dir),
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT,
+        )
+        output, _ = await process.communicate()
+        _check_pass(compiler, process.returncode, output, build_dir, jobname)
+        after = aux_snapshot(build_dir, jobname)
+        if after == before:
+            return passes
+        before = after
+    print(f"Warning: {jobname} aux files still changing after {max_passes} passes.")
+    return max_passes
+
+
+def default_build_dir(tex_path):
+    """Persistent build directory for a document: .latex-build/<jobname> next to the .tex."""
+    jobname = os.path.splitext(os.path.basename(tex_path))[0]
+    return os.path.join(os.path.dirname(os.path.abspath(tex_path)), '.latex-build', jobname)
+
+
+def build_pdf(tex_path, build_dir=None, compiler=LATEX_COMPILER, max_passes=LATEX_MAX_PASSES):
+    """Compile tex_path and copy the PDF next to it. Returns (pdf_path, passes)."""
+    build_dir = build_dir or default_build_dir(tex_path)
+    passes = compile_latex(tex_path, build_dir, compiler=compiler, max_passes=max_passes)
+    jobname = os.path.splitext(os.path.basename(tex_path))[0]
+    pdf_path = os.path.splitext(tex_path)[0] + '.pdf'
+    shutil.copyfile(os.path.join(build_dir, jobname + '.pdf'), pdf_path)
+    return pdf_path, passes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile a .tex file, rerunning only while aux files change.")
+    parser.add_argument('tex_file')
+    parser.add_argument('--build-dir', help="Persistent build directory (default: .latex-build/<jobname>)")
+    parser.add_argument('--compiler', default=LATEX_COMPILER)
+    parser.add_argument('--max-passes', type=int, default=LATEX_MAX_PASSES)
+    args = parser.parse_args(argv)
+
+    try:
+        pdf_path, passes = build_pdf(args.tex_file, args.build_dir, args.compiler, args.max_passes)
+    except (OSError, LatexError) as e:
+        print(f"Could not generate PDF: {e}")
+        return 1
+    print(f"Generated {pdf_path} in {passes} pass{'es' if passes != 1 else ''}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
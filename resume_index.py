@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Full-text inverted index over a corpus of resume.yaml files.
+
+The index lives in a single SQLite file. Each resume contributes postings for
+its companies, titles, responsibilities, skills and projects; skill ratings are
+stored alongside so queries can filter on them. Re-running ``build`` only
+reparses files whose size, mtime or content changed, and drops files that have
+disappeared.
+
+Usage:
+    python resume_index.py build resumes/ --index resumes.idx
+    python resume_index.py query "swift ci/cd" --index resumes.idx
+    python resume_index.py query "skill:swift company:wayfair" --min-rating swift=4
+"""
+
+import argparse
+import math
+import os
+import sqlite3
+import sys
+import time
+from collections import Counter
+
+import yaml
+
+from generate_resume_artifact import load_yaml_data, sha256_file, tokenize
+
+# Fields that can be searched, with their BM25 weight.
+FIELD_WEIGHTS = {
+    'company': 2.0,
+    'title': 2.0,
+    'skill': 3.0,
+    'project': 1.5,
+    'responsibility': 1.0,
+}
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    name TEXT,
+    length INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    field TEXT NOT NULL,
+    doc_id INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    tf INTEGER NOT NULL,
+    PRIMARY KEY (term, field, doc_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_doc ON postings(doc_id);
+CREATE TABLE IF NOT EXISTS skills (
+    doc_id INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    rating INTEGER,
+    PRIMARY KEY (name, doc_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS skills_doc ON skills(doc_id);
+"""
+
+
+def extract_fields(resume_data):
+    """Return ({field: [text, ...]}, [(skill_name, rating), ...]) for a resume."""
+    fields = {field: [] for field in FIELD_WEIGHTS}
+    skills = []
+
+    for job in resume_data.get('experience') or []:
+        if not isinstance(job, dict):
+            continue
+        if job.get('company'):
+            fields['company'].append(job['company'])
+        if job.get('title'):
+            fields['title'].append(job['title'])
+        for responsibility in job.get('responsibilities') or []:
+            fields['responsibility'].append(responsibility)
+
+    for category in (resume_data.get('skills') or {}).values():
+        if not isinstance(category, list):
+            continue
+        for skill in category:
+            if isinstance(skill, dict) and skill.get('name'):
+                fields['skill'].append(skill['name'])
+                rating = skill.get('rating')
+                skills.append((str(skill['name']).lower(), rating if isinstance(rating, int) else None))
+
+    for section in ('personal_projects', 'open_source_contributions'):
+        for project in resume_data.get(section) or []:
+            if not isinstance(project, dict):
+                continue
+            for key in ('name', 'description'):
+                if project.get(key):
+                    fields['project'].append(project[key])
+            technologies = project.get('technologies') or []
+            if isinstance(technologies, str):
+                technologies = [technologies]
+            fields['project'].extend(technologies)
+
+    return fields, skills
+
+
+def parse_query(query):
+    """Split a query string into [(field or None, token), ...]. Supports ``field:term``."""
+    terms = []
+    for word in query.split():
+        field = None
+        if ':' in word:
+            prefix, rest = word.split(':', 1)
+            if prefix in FIELD_WEIGHTS:
+                field, word = prefix, rest
+        for token in tokenize(word):
+            terms.append((field, token))
+    return terms
+
+
+class ResumeIndex:
+    """On-disk inverted index over resume YAML files."""
+
+    def __init__(self, index_path):
+        self.index_path = index_path
+        self.conn = sqlite3.connect(index_path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _index_document(self, path, stat, sha256, resume_data):
+        fields, skills = extract_fields(resume_data)
+        postings = []
+        length = 0
+        for field, texts in fields.items():
+            counts = Counter(token for text in texts for token in tokenize(text))
+            length += sum(counts.values())
+            postings.extend((term, field, tf) for term, tf in counts.items())
+
+        self.conn.execute("DELETE FROM documents WHERE path = ?", (path,))
+        cursor = self.conn.execute(
+            "INSERT INTO documents (path, mtime_ns, size, sha256, name, length) VALUES (?, ?, ?, ?, ?, ?)",
+            (path, stat.st_mtime_ns, stat.st_size, sha256, resume_data.get('name'), length)
+        )
+        doc_id = cursor.lastrowid
+        self.conn.executemany(
+            "INSERT INTO postings (term, field, doc_id, tf) VALUES (?, ?, ?, ?)",
+            ((term, field, doc_id, tf) for term, field, tf in postings)
+        )
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO skills (doc_id, name, rating) VALUES (?, ?, ?)",
+            ((doc_id, name, rating) for name, rating in skills)
+        )
+
+    def update_file(self, path):
+        """Index or reindex one file if it changed and commit. Returns True if the index was modified."""
+        with self.conn:
+            return self._update_file(path)
+
+    def remove_file(self, path):
+        """Drop a file from the index and commit. Returns True if it was indexed."""
+        with self.conn:
+            return self._remove_file(path)
+
+    def _update_file(self, path):
+        path = os.path.abspath(path)
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            print(f"Error reading {path}: {e}")
+            return self._remove_file(path)
+        row = self.conn.execute(
+            "SELECT mtime_ns, size, sha256 FROM documents WHERE path = ?", (path,)
+        ).fetchone()
+        if row and row[0] == stat.st_mtime_ns and row[1] == stat.st_size:
+            return False
+
+        # On any failure, drop the old entry so queries stop matching content the file no longer has.
+        try:
+            sha256 = sha256_file(path)
+            if row and row[2] == sha256:
+                # Touched but not edited; remember the new mtime so we skip it next time.
+                self.conn.execute("UPDATE documents SET mtime_ns = ? WHERE path = ?", (stat.st_mtime_ns, path))
+                return False
+            resume_data = load_yaml_data(path)
+        except yaml.YAMLError as e:
+            print(f"Error parsing YAML file {path}: {e}")
+            return self._remove_file(path)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Error reading {path}: {e}")
+            return self._remove_file(path)
+        if not isinstance(resume_data, dict):
+            print(f"Warning: {path} does not contain a resume mapping. Skipping.")
+            return self._remove_file(path)
+
+        self._index_document(path, stat, sha256, resume_data)
+        return True
+
+    def _remove_file(self, path):
+        cursor = self.conn.execute("DELETE FROM documents WHERE path = ?", (os.path.abspath(path),))
+        return cursor.rowcount > 0
+
+    def update(self, paths):
+        """Incrementally index the given files and directories.
+
+        Directories are scanned for *.yaml / *.yml files; indexed files under a
+        scanned directory that no longer exist are removed, as are explicit
+        file paths that no longer exist.
+        Everything is committed as one transaction.
+        Returns (updated, removed) counts.
+        """
+        updated = 0
+        removed = 0
+        seen = set()
+        scanned_dirs = []
+        with self.conn:
+            for path in paths:
+                if os.path.isdir(path):
+                    scanned_dirs.append(os.path.join(os.path.abspath(path), ''))
+                    for root, _dirs, files in os.walk(path):
+                        for file_name in files:
+                            if file_name.endswith(('.yaml', '.yml')):
+                                file_path = os.path.abspath(os.path.join(root, file_name))
+                                seen.add(file_path)
+                                updated += self._update_file(file_path)
+                elif not os.path.exists(path):
+                    print(f"Warning: {path} not found. Removing it from the index.")
+                    removed += self._remove_file(path)
+                else:
+                    seen.add(os.path.abspath(path))
+                    updated += self._update_file(path)
+
+            for dir_prefix in scanned_dirs:
+                rows = self.conn.execute(
+                    "SELECT path FROM documents WHERE substr(path, 1, ?) = ?", (len(dir_prefix), dir_prefix)
+                ).fetchall()
+                for (indexed_path,) in rows:
+                    if indexed_path not in seen:
+                        removed += self._remove_file(indexed_path)
+        return updated, removed
+
+    def query(self, query, limit=10, min_ratings=None):
+        """Return up to ``limit`` (score, path, name) tuples ranked by BM25.
+
+        ``min_ratings`` maps lowercase skill names to the minimum rating a
+        resume must have for that skill.
+        """
+        terms = parse_query(query)
+        if not terms and not min_ratings:
+            return []
+
+        doc_count, avg_length = self.conn.execute(
+            "SELECT COUNT(*), AVG(length) FROM documents"
+        ).fetchone()
+        if not doc_count:
+            return []
+        avg_length = avg_length or 1.0
+
+        lengths = {}
+        scores = Counter()
+        for field, term in terms:
+            fields = [field] if field else list(FIELD_WEIGHTS)
+            placeholders = ','.join('?' * len(fields))
+            rows = self.conn.execute(
+                f"SELECT p.field, p.doc_id, p.tf, d.length FROM postings p JOIN documents d ON d.id = p.doc_id "
+                f"WHERE p.term = ? AND p.field IN ({placeholders})",
+                (term, *fields)
+            ).fetchall()
+            doc_freq = len({doc_id for _field, doc_id, _tf, _length in rows})
+            idf = math.log(1 + (doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
+            for row_field, doc_id, tf, length in rows:
+                lengths[doc_id] = length
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+                scores[doc_id] += FIELD_WEIGHTS[row_field] * idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+        if min_ratings:
+            allowed = None
+            for skill_name, min_rating in min_ratings.items():
+                rows = self.conn.execute(
+                    "SELECT doc_id FROM skills WHERE name = ? AND rating >= ?", (skill_name.lower(), min_rating)
+                ).fetchall()
+                matching = {doc_id for (doc_id,) in rows}
+                allowed = matching if allowed is None else allowed & matching
+            if terms:
+                scores = Counter({doc_id: score for doc_id, score in scores.items() if doc_id in allowed})
+            else:
+                scores = Counter({doc_id: 0.0 for doc_id in allowed})
+
+        results = []
+        for doc_id, score in scores.most_common(limit):
+            path, name = self.conn.execute(
+                "SELECT path, name FROM documents WHERE id = ?", (doc_id,)
+            ).fetchone()
+            results.append((score, path, name))
+        return results
+
+
+def parse_min_ratings(values):
+    """Parse ["swift=4", ...] into {"swift": 4, ...}."""
+    min_ratings = {}
+    for value in values or []:
+        name, _, rating = value.rpartition('=')
+        if not name or not rating.isdigit():
+            raise argparse.ArgumentTypeError(f"Expected SKILL=RATING, got '{value}'")
+        min_ratings[name.lower()] = int(rating)
+    return min_ratings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build and query an inverted index over resume YAML files.")
+    parser.add_argument('--index', default='resumes.idx', help="Path to the index database (default: resumes.idx)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help="Index or incrementally update files and directories")
+    build_parser.add_argument('paths', nargs='+')
+
+    query_parser = subparsers.add_parser('query', help="Run a ranked query")
+    query_parser.add_argument('query', nargs='?', default='')
+    query_parser.add_argument('--limit', type=int, default=10)
+    query_parser.add_argument('--min-rating', action='append', metavar='SKILL=RATING',
+                              help="Only return resumes rating SKILL at least RATING (repeatable)")
+
+    args = parser.parse_args(argv)
+
+    with ResumeIndex(args.index) as index:
+        if args.command == 'build':
+            start = time.perf_counter()
+            updated, removed = index.update(args.paths)
+            elapsed = time.perf_counter() - start
+            print(f"Indexed {updated} changed file(s), removed {removed} in {elapsed:.2f}s")
+        else:
+            try:
+                min_ratings = parse_min_ratings(args.min_rating)
+            except argparse.ArgumentTypeError as e:
+                parser.error(str(e))
+            start = time.perf_counter()
+            results = index.query(args.query, limit=args.limit, min_ratings=min_ratings)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            for score, path, name in results:
+                print(f"{score:8.3f}  {name or '(unnamed)'}  {path}")
+            print(f"{len(results)} result(s) in {elapsed_ms:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Durable SQLite-backed job queue for rendering resumes across many workers.
+
+Each job holds one resume (copied out of the input file at enqueue time) and
+the formats to render. Workers lease a job, heartbeat while rendering, and
+mark it done or failed. A worker that crashes simply stops heartbeating; once
+its lease expires the job is handed to another worker, up to max_attempts.
+
+Several processes (or machines sharing the database file) can run workers
+against the same queue. The database uses SQLite's default rollback journal
+rather than WAL so it also works on network filesystems.
+
+Usage:
+    python resume_jobs.py --db jobs.db enqueue batch.yaml --format md --format latex-pdf
+    python resume_jobs.py --db jobs.db worker -o output/batch --processes 4
+    python resume_jobs.py --db jobs.db status
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import socket
+import sqlite3
+import sys
+import threading
+import time
+
+import yaml
+
+from resume_stream import iter_resumes, slugify
+
+DEFAULT_FORMATS = ('md', 'html', 'tex')
+ALL_FORMATS = ('md', 'html', 'tex', 'latex-pdf', 'html-pdf')
+ENQUEUE_BATCH_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    input_path TEXT NOT NULL,
+    doc_index INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    formats TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_expires REAL,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs(status, available_at);
+-- One job per input document, so re-running an interrupted enqueue adds only what is missing.
+CREATE UNIQUE INDEX IF NOT EXISTS jobs_document ON jobs(input_path, doc_index);
+"""
+
+
+class JobQueue:
+    """Job queue stored in a single SQLite database file."""
+
+    def __init__(self, db_path, timeout=30.0):
+        self.db_path = db_path
+        # isolation_level=None: we issue BEGIN IMMEDIATE ourselves so leasing is atomic.
+        self.conn = sqlite3.connect(db_path, timeout=timeout, isolation_level=None)
+        self.conn.execute("PRAGMA busy_timeout = %d" % int(timeout * 1000))
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _transaction(self):
+        return _ImmediateTransaction(self.conn)
+
+    def enqueue(self, input_path, resumes, formats, max_attempts=3):
+        """Add one job per resume in ``resumes``. Returns the number of jobs added.
+
+        Documents already queued from the same input path are skipped, so an
+        enqueue that stopped partway can simply be run again. Values JSON
+        cannot represent, such as the datetime.date YAML produces for unquoted
+        dates, are stored as their string form.
+        """
+        formats_json = json.dumps(sorted(set(formats)))
+        input_path = os.path.abspath(input_path)
+        count = 0
+        batch = []
+        for doc_index, resume_data in enumerate(resumes):
+            batch.append((input_path, doc_index, json.dumps(resume_data, default=str), formats_json, max_attempts))
+            if len(batch) >= ENQUEUE_BATCH_SIZE:
+                count += self._insert_jobs(batch)
+                batch = []
+        if batch:
+            count += self._insert_jobs(batch)
+        return count
+
+    def _insert_jobs(self, rows):
+        # Commit in batches so a huge enqueue does not hold the write lock for its whole run.
+        now = time.time()
+        with self._transaction():
+            cursor = self.conn.executemany(
+                "INSERT OR IGNORE INTO jobs (input_path, doc_index, payload, formats, max_attempts, available_at, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                ((*row, now, now, now) for row in rows)
+            )
+        return cursor.rowcount
+
+    def lease(self, worker_id, lease_seconds=60.0):
+        """Atomically claim the next runnable job. Returns a job dict or None."""
+        now = time.time()
+        with self._transaction():
+            # Jobs whose lease expired after their last allowed attempt are dead.
+            self.conn.execute(
+                "UPDATE jobs SET status = 'failed', error = COALESCE(error, 'lease expired'), updated_at = ? "
+                "WHERE status = 'leased' AND lease_expires < ? AND attempts >= max_attempts",
+                (now, now)
+            )
+            row = self.conn.execute(
+                "SELECT id FROM jobs "
+                "WHERE (status = 'queued' AND available_at <= ?) OR (status = 'leased' AND lease_expires < ?) "
+                "ORDER BY id LIMIT 1",
+                (now, now)
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute(
+                "UPDATE jobs SET status = 'leased', attempts = attempts + 1, lease_owner = ?, "
+                "lease_expires = ?, updated_at = ? WHERE id = ?",
+                (worker_id, now + lease_seconds, now, row[0])
+            )
+            job = self.conn.execute(
+                "SELECT id, input_path, doc_index, payload, formats, attempts FROM jobs WHERE id = ?", (row[0],)
+            ).fetchone()
+        return {
+            'id': job[0],
+            'input_path': job[1],
+            'doc_index': job[2],
+            'resume_data': json.loads(job[3]),
+            'formats': json.loads(job[4]),
+            'attempts': job[5],
+        }
+
+    def heartbeat(self, job_id, worker_id, lease_seconds=60.0):
+        """Extend a lease. Returns False if the worker no longer owns the job."""
+        now = time.time()
+        with self._transaction():
+            cursor = self.conn.execute(
+                "UPDATE jobs SET lease_expires = ?, updated_at = ? "
+                "WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (now + lease_seconds, now, job_id, worker_id)
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id, worker_id, result):
+        """Mark a leased job as done. Returns False if the lease was lost."""
+        now = time.time()
+        with self._transaction():
+            cursor = self.conn.execute(
+                "UPDATE jobs SET status = 'done', result = ?, error = NULL, lease_owner = NULL, "
+                "lease_expires = NULL, updated_at = ? WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (json.dumps(result), now, job_id, worker_id)
+            )
+        return cursor.rowcount == 1
+
+    def fail(self, job_id, worker_id, error, retry_delay=5.0):
+        """Record a failed attempt; requeue with backoff or mark failed if out of attempts."""
+        now = time.time()
+        with self._transaction():
+            row = self.conn.execute(
+                "SELECT attempts, max_attempts FROM jobs WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (job_id, worker_id)
+            ).fetchone()
+            if row is None:
+                return False
+            attempts, max_attempts = row
+            status = 'failed' if attempts >= max_attempts else 'queued'
+            self.conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, available_at = ?, lease_owner = NULL, "
+                "lease_expires = NULL, updated_at = ? WHERE id = ?",
+                (status, str(error)[-4000:], now + retry_delay * attempts, now, job_id)
+            )
+        return True
+
+    def counts(self):
+        """Return {status: count} for every status present."""
+        return dict(self.conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+
+
+class _ImmediateTransaction:
+    """BEGIN IMMEDIATE ... COMMIT/ROLLBACK, taking the write lock up front."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+class _Heartbeat(threading.Thread):
+    """Background thread that keeps a job's lease alive while it renders."""
+
+    def __init__(self, db_path, job_id, worker_id, lease_seconds):
+        super().__init__(daemon=True)
+        self.db_path = db_path
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.stopped = threading.Event()
+
+    def run(self):
+        with JobQueue(self.db_path) as queue:
+            while not self.stopped.wait(self.lease_seconds / 3):
+                if not queue.heartbeat(self.job_id, self.worker_id, self.lease_seconds):
+                    print(f"Warning: Lost lease on job {self.job_id}")
+                    return
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+def render_job(job, output_dir, project_root):
+    """Render one job with the existing generators. Returns the list of files written."""
+    from latex_driver import compile_latex
+    from resume_pipeline import Pipeline, html_to_pdf
+
+    resume_data = job['resume_data']
+    formats = set(job['formats'])
+    base_name = f"{job['id']:07d}-{slugify(resume_data.get('name', 'resume'))}"
+    pipeline = Pipeline(output_dir, project_root, formats)
+    os.makedirs(output_dir, exist_ok=True)
+    tex_path, html_content = pipeline.render_text(base_name, resume_data)
+
+    written = [os.path.join(output_dir, f"{base_name}.{ext}") for ext in ('md', 'html', 'tex') if ext in formats]
+    if 'latex-pdf' in formats:
+        build_dir = os.path.join(output_dir, '.latex-build', base_name)
+        compile_latex(tex_path, build_dir)
+        pdf_path = os.path.join(output_dir, f"{base_name}.pdf")
+        shutil.copyfile(os.path.join(build_dir, f"{base_name}.pdf"), pdf_path)
+        written.append(pdf_path)
+    if 'html-pdf' in formats:
+        written.append(html_to_pdf(html_content, project_root, os.path.join(output_dir, f"{base_name}.html.pdf")))
+    return written
+
+
+def run_worker(db_path, output_dir, project_root, lease_seconds=60.0, idle_exit=None, poll_interval=1.0):
+    """Pull and render jobs until the queue is idle for ``idle_exit`` seconds (forever if None)."""
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    processed = 0
+    idle_since = time.time()
+    with JobQueue(db_path) as queue:
+        while True:
+            job = queue.lease(worker_id, lease_seconds)
+            if job is None:
+                if idle_exit is not None and time.time() - idle_since >= idle_exit:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            heartbeat = _Heartbeat(db_path, job['id'], worker_id, lease_seconds)
+            heartbeat.start()
+            try:
+                written = render_job(job, output_dir, project_root)
+            except Exception as e:
+                heartbeat.stop()
+                print(f"[{worker_id}] Job {job['id']} failed (attempt {job['attempts']}): {e}")
+                queue.fail(job['id'], worker_id, e)
+            else:
+                heartbeat.stop()
+                if queue.complete(job['id'], worker_id, written):
+                    processed += 1
+            idle_since = time.time()
+    print(f"[{worker_id}] Processed {processed} jobs")
+    return processed
+
+
+def main(argv=None):
+    project_root = os.path.dirname(os.path.abspath(__file__))
+
+    parser = argparse.ArgumentParser(description="SQLite-backed job queue for batch resume rendering.")
+    parser.add_argument('--db', default='jobs.db', help="Path to the queue database (default: jobs.db)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    enqueue_parser = subparsers.add_parser('enqueue', help="Add one job per resume in an input file")
+    enqueue_parser.add_argument('input', help="Resume YAML (single or multi-document) or JSON Lines file")
+    enqueue_parser.add_argument('--input-type', choices=('yaml', 'jsonl'))
+    enqueue_parser.add_argument('--format', action='append', dest='formats', choices=ALL_FORMATS,
+                                help="Format to render (repeatable, default: md, html, tex)")
+    enqueue_parser.add_argument('--max-attempts', type=int, default=3)
+
+    worker_parser = subparsers.add_parser('worker', help="Pull jobs and render them")
+    worker_parser.add_argument('-o', '--output-dir', default=os.path.join(project_root, 'output', 'batch'))
+    worker_parser.add_argument('--processes', type=int, default=1, help="Local worker processes to start (default: 1)")
+    worker_parser.add_argument('--lease-seconds', type=float, default=60.0)
+    worker_parser.add_argument('--idle-exit', type=float, default=None,
+                               help="Exit after the queue has been empty this many seconds (default: run forever)")
+
+    subparsers.add_parser('status', help="Show job counts by status")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'enqueue':
+        stats = {'read': 0}
+
+        def resumes():
+            for resume_data in iter_resumes(args.input, args.input_type):
+                stats['read'] += 1
+                yield resume_data
+
+        try:
+            with JobQueue(args.db) as queue:
+                count = queue.enqueue(args.input, resumes(), args.formats or DEFAULT_FORMATS,
+                                      max_attempts=args.max_attempts)
+        except FileNotFoundError:
+            print(f"Error: The file {args.input} was not found.")
+            return 1
+        except yaml.YAMLError as e:
+            print(f"Error parsing YAML stream after {stats['read']} resumes: {e}")
+            print("Fix the input and run enqueue again; documents already queued are skipped.")
+            return 1
+        print(f"Enqueued {count} jobs into {args.db}")
+    elif args.command == 'worker':
+        worker_args = (args.db, args.output_dir, project_root, args.lease_seconds, args.idle_exit)
+        if args.processes <= 1:
+            run_worker(*worker_args)
+        else:
+            processes = [multiprocessing.Process(target=run_worker, args=worker_args) for _ in range(args.processes)]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+    else:
+        with JobQueue(args.db) as queue:
+            for status, count in sorted(queue.counts().items()):
+                print(f"{status:8s} {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Typed, low-memory resume model.
+
+Every loader returns nested dicts from yaml.safe_load. That is fine for one
+resume, but tens of thousands of them pay for a dict per entry and a fresh
+copy of every repeated string ("New York, NY", skill names, category keys).
+The classes here are __slots__ dataclasses, and short repeated strings are
+interned with sys.intern so each distinct value is stored once.
+
+The model classes are read-only Mappings over the keys their source dict had
+(missing keys stay missing, explicit nulls read as None), so generate_readme,
+generate_resume and the Jinja HTML template accept them in place of the dicts
+they already use and produce identical output.
+
+Usage:
+    python resume_model.py --benchmark 10000
+"""
+
+import argparse
+import json
+import sys
+import tracemalloc
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+
+import yaml
+
+
+def _intern(value):
+    """Intern short strings shared across many resumes; pass anything else through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _intern_list(values):
+    if values is None:
+        return None
+    if isinstance(values, str):
+        return _intern(values)
+    return [_intern(value) for value in values]
+
+
+class _FieldMapping(Mapping):
+    """Read-only dict-style access to the fields a slotted dataclass was built from.
+
+    A slot is only filled when its key was present in the source dict, so a
+    missing key stays missing and an explicit null reads back as None, exactly
+    like the dict yaml.safe_load returns (and Jinja, which tries attributes
+    before items, sees the same thing for both).
+    """
+
+    __slots__ = ()
+    _interned = frozenset()
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build an instance from a dict. Unknown keys are dropped."""
+        instance = cls.__new__(cls)
+        for key, value in data.items():
+            if key in cls._field_names:
+                object.__setattr__(instance, key, cls._convert(key, value))
+        return instance
+
+    @classmethod
+    def _convert(cls, key, value):
+        return _intern(value) if key in cls._interned else value
+
+    def __getitem__(self, key):
+        if key in self._field_names:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def __iter__(self):
+        return (name for name in self._field_order if hasattr(self, name))
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def to_dict(self):
+        """Convert back to the plain nested dict shape yaml.safe_load produces."""
+        return {name: _to_plain(self[name]) for name in self}
+
+
+def _to_plain(value):
+    if isinstance(value, _FieldMapping):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {key: _to_plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_to_plain(item) for item in value]
+    return value
+
+
+def _field_names(cls):
+    cls._field_order = tuple(field.name for field in fields(cls))
+    cls._field_names = frozenset(cls._field_order)
+    return cls
+
+
+def _model(cls):
+    """Slotted dataclass whose fields are set only for keys present in the source dict."""
+    return _field_names(dataclass(slots=True, eq=False, init=False, repr=False)(cls))
+
+
+@_model
+class Contact(_FieldMapping):
+    name: str
+    email: str
+    phone: str
+    location: str
+    website: str
+    linkedin: str
+    github: str
+
+    _interned = frozenset(('name', 'email', 'phone', 'location', 'website', 'linkedin', 'github'))
+
+
+@_model
+class Link(_FieldMapping):
+    title: str
+    url: str
+
+    _interned = frozenset(('title',))
+
+
+@_model
+class Experience(_FieldMapping):
+    company: str
+    location: str
+    title: str
+    start_date: str
+    end_date: str
+    responsibilities: list
+    app_store_url: str
+    media_urls: list
+
+    _interned = frozenset(('company', 'location', 'title', 'start_date', 'end_date'))
+
+
+@_model
+class Project(_FieldMapping):
+    name: str
+    description: str
+    app_store_link: str
+    links: list
+    technologies: list
+
+    _interned = frozenset(('name', 'app_store_link'))
+
+    @classmethod
+    def _convert(cls, key, value):
+        if key == 'links' and isinstance(value, list):
+            return [Link.from_dict(link) if isinstance(link, dict) else link for link in value]
+        if key == 'technologies':
+            return _intern_list(value)
+        return _intern(value) if key in cls._interned else value
+
+
+@_model
+class Skill(_FieldMapping):
+    name: str
+    rating: int
+
+    _interned = frozenset(('name',))
+
+
+@_model
+class Education(_FieldMapping):
+    institution: str
+    degree: str
+    major: str
+    date: str
+    graduation_date: str
+    graduation_year: str
+    details: str
+
+    _interned = frozenset(('institution', 'degree', 'major', 'date', 'graduation_date', 'graduation_year', 'details'))
+
+
+@_model
+class Resume(_FieldMapping):
+    name: str
+    contact: Contact
+    profile: object
+    experience: list
+    personal_projects: list
+    open_source_contributions: list
+    skills: dict
+    education: list
+
+    _interned = frozenset(('name',))
+    _entry_models = {
+        'experience': Experience,
+        'personal_projects': Project,
+        'open_source_contributions': Project,
+        'education': Education,
+    }
+
+    @classmethod
+    def _convert(cls, key, value):
+        if key == 'contact' and isinstance(value, dict):
+            return Contact.from_dict(value)
+        if key in cls._entry_models and isinstance(value, list):
+            model = cls._entry_models[key]
+            return [model.from_dict(item) if isinstance(item, dict) else item for item in value]
+        if key == 'skills' and isinstance(value, dict):
+            return {
+                _intern(category): [Skill.from_dict(skill) if isinstance(skill, dict) else skill for skill in items]
+                if isinstance(items, list) else items
+                for category, items in value.items()
+            }
+        return _intern(value) if key in cls._interned else value
+
+
+def load_resume(yaml_file_path):
+    """Load a resume.yaml file into a Resume."""
+    with open(yaml_file_path, 'r', encoding='utf-8') as file:
+        return Resume.from_dict(yaml.safe_load(file))
+
+
+def _measure(build, count):
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    items = [build() for _ in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return current - baseline
+
+
+def run_benchmark(yaml_file_path, count):
+    """Compare retained memory for ``count`` resumes held as dicts vs Resume objects."""
+    with open(yaml_file_path, 'r', encoding='utf-8') as file:
+        serialized = json.dumps(yaml.safe_load(file))
+
+    # json.loads gives every copy its own strings, like separately parsed YAML files.
+    dict_bytes = _measure(lambda: json.loads(serialized), count)
+    model_bytes = _measure(lambda: Resume.from_dict(json.loads(serialized)), count)
+
+    print(f"{count} resumes from {yaml_file_path}:")
+    print(f"  dicts:  {dict_bytes / 1024 / 1024:8.1f} MiB ({dict_bytes / count / 1024:.1f} KiB each)")
+    print(f"  Resume: {model_bytes / 1024 / 1024:8.1f} MiB ({model_bytes / count / 1024:.1f} KiB each)")
+    print(f"  saved:  {(1 - model_bytes / dict_bytes) * 100:8.1f}%")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Slotted, interned resume model.")
+    parser.add_argument('yaml_file', nargs='?', default='resume.yaml')
+    parser.add_argument('--benchmark', type=int, metavar='N', default=1000,
+                        help="Number of resume copies to hold in memory (default: 1000)")
+    args = parser.parse_args(argv)
+    run_benchmark(args.yaml_file, args.benchmark)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Overlapped asyncio pipeline for rendering many resumes to every format.
+
+Stages:
+    read      -> resume_stream.iter_resumes() (one document at a time, in a thread)
+    render    -> Markdown, HTML and .tex text (in a thread)
+    latex     -> aux-aware pdflatex runs as async subprocesses, bounded by --latex-jobs
+    weasyprint-> HTML to PDF in a process pool, bounded by --pdf-workers
+
+YAML parsing and rendering are blocking, so they run in worker threads and
+the event loop stays free to drain pdflatex output and feed the other stages.
+
+Stages are connected by bounded queues, so a slow stage applies backpressure
+to the reader instead of letting rendered documents pile up in memory, while
+TeX subprocess slots and CPU cores stay busy at the same time.
+
+Usage:
+    python resume_pipeline.py batch.yaml -o output/batch --latex-jobs 4 --pdf-workers 4
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import yaml
+
+from latex_driver import LatexError, compile_latex_async
+from resume_stream import iter_resumes, load_html_template, slugify
+
+_END_OF_INPUT = object()
+
+
+def html_to_pdf(html_content, base_url, output_path):
+    """Lay out HTML with WeasyPrint and write a PDF. Runs inside a worker process."""
+    from weasyprint import HTML
+    HTML(string=html_content, base_url=base_url).write_pdf(output_path)
+    return output_path
+
+
+class Pipeline:
+    """Bounded-queue pipeline that overlaps rendering, LaTeX and WeasyPrint work."""
+
+    def __init__(self, output_dir, project_root, formats, latex_jobs=2, pdf_workers=None, queue_size=8):
+        self.output_dir = output_dir
+        self.project_root = project_root
+        self.formats = set(formats)
+        self.latex_jobs = latex_jobs
+        self.pdf_workers = pdf_workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.stats = {'read': 0, 'rendered': 0, 'latex': 0, 'latex_passes': 0, 'weasyprint': 0, 'errors': 0}
+
+    def render_text(self, base_name, resume_data):
+        """Render the text formats for one resume. Returns (tex_path, html_content)."""
+        tex_path = None
+        html_content = None
+
+        if 'md' in self.formats:
+            from generate_readme import generate_markdown
+            with open(os.path.join(self.output_dir, f"{base_name}.md"), 'w', encoding='utf-8') as file:
+                file.write(generate_markdown(resume_data))
+
+        if 'html' in self.formats or 'html-pdf' in self.formats:
+            html_content = load_html_template(self.project_root).render(resume_data=resume_data)
+            if 'html' in self.formats:
+                with open(os.path.join(self.output_dir, f"{base_name}.html"), 'w', encoding='utf-8') as file:
+                    file.write(html_content)
+
+        if 'tex' in self.formats or 'latex-pdf' in self.formats:
+            from generate_resume_fast import create_latex_source
+            tex_path = os.path.join(self.output_dir, f"{base_name}.tex")
+            with open(tex_path, 'w', encoding='utf-8') as file:
+                file.write(create_latex_source(resume_data))
+
+        return tex_path, html_content
+
+    async def _read(self, resumes, render_queue):
+        resumes = iter(resumes)
+        i = 0
+        # Pull each document in a thread; parsing a large YAML stream blocks.
+        while (resume_data := await asyncio.to_thread(next, resumes, _END_OF_INPUT)) is not _END_OF_INPUT:
+            i += 1
+            await render_queue.put((f"{i:05d}-{slugify(resume_data.get('name', 'resume'))}", resume_data))
+            self.stats['read'] += 1
+        await render_queue.put(None)
+
+    async def _render(self, render_queue, latex_queue, pdf_queue):
+        while (item := await render_queue.get()) is not None:
+            base_name, resume_data = item
+            try:
+                tex_path, html_content = await asyncio.to_thread(self.render_text, base_name, resume_data)
+            except Exception as e:
+                print(f"Error rendering {base_name}: {e}")
+                self.stats['errors'] += 1
+                continue
+            self.stats['rendered'] += 1
+            if tex_path and 'latex-pdf' in self.formats:
+                await latex_queue.put((base_name, tex_path))
+            if html_content is not None and 'html-pdf' in self.formats:
+                await pdf_queue.put((base_name, html_content))
+        for _ in range(self.latex_jobs):
+            await latex_queue.put(None)
+        for _ in range(self.pdf_workers):
+            await pdf_queue.put(None)
+
+    async def _latex_worker(self, latex_queue):
+        build_root = os.path.join(self.output_dir, '.latex-build')
+        while (item := await latex_queue.get()) is not None:
+            base_name, tex_path = item
+            build_dir = os.path.join(build_root, base_name)
+            try:
+                passes = await compile_latex_async(tex_path, build_dir)
+                self.stats['latex_passes'] += passes
+                shutil.copyfile(os.path.join(build_dir, f"{base_name}.pdf"),
+                                os.path.join(self.output_dir, f"{base_name}.pdf"))
+                self.stats['latex'] += 1
+            except (OSError, LatexError) as e:
+                print(f"Error compiling {base_name}.tex: {e}")
+                self.stats['errors'] += 1
+
+    async def _pdf_worker(self, pdf_queue, executor):
+        loop = asyncio.get_running_loop()
+        while (item := await pdf_queue.get()) is not None:
+            base_name, html_content = item
+            output_path = os.path.join(self.output_dir, f"{base_name}.html.pdf")
+            try:
+                await loop.run_in_executor(executor, html_to_pdf, html_content, self.project_root, output_path)
+                self.stats['weasyprint'] += 1
+            except Exception as e:
+                print(f"Error generating PDF with WeasyPrint for {base_name}: {e}")
+                self.stats['errors'] += 1
+
+    async def run(self, resumes):
+        """Push every resume through the pipeline and return the stats dictionary."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        render_queue = asyncio.Queue(maxsize=self.queue_size)
+        latex_queue = asyncio.Queue(maxsize=self.queue_size)
+        pdf_queue = asyncio.Queue(maxsize=self.queue_size)
+
+        with ProcessPoolExecutor(max_workers=self.pdf_workers) as executor:
+            await asyncio.gather(
+                self._read(resumes, render_queue),
+                self._render(render_queue, latex_queue, pdf_queue),
+                *(self._latex_worker(latex_queue) for _ in range(self.latex_jobs)),
+                *(self._pdf_worker(pdf_queue, executor) for _ in range(self.pdf_workers)),
+            )
+        return self.stats
+
+
+def main(argv=None):
+    project_root = os.path.dirname(os.path.abspath(__file__))
+
+    parser = argparse.ArgumentParser(description="Render many resumes with overlapped LaTeX and WeasyPrint stages.")
+    parser.add_argument('input', help="Resume YAML (single or multi-document) or JSON Lines file, or '-' for stdin")
+    parser.add_argument('--input-type', choices=('yaml', 'jsonl'))
+    parser.add_argument('--format', action='append', dest='formats',
+                        choices=('md', 'html', 'tex', 'latex-pdf', 'html-pdf'),
+                        help="Output format (repeatable, default: all)")
+    parser.add_argument('-o', '--output-dir', default=os.path.join(project_root, 'output', 'batch'))
+    parser.add_argument('--latex-jobs', type=int, default=2, help="Concurrent pdflatex processes (default: 2)")
+    parser.add_argument('--pdf-workers', type=int, default=None, help="WeasyPrint worker processes (default: CPU count)")
+    parser.add_argument('--queue-size', type=int, default=8, help="Max items buffered between stages (default: 8)")
+    args = parser.parse_args(argv)
+
+    formats = args.formats or ['md', 'html', 'tex', 'latex-pdf', 'html-pdf']
+    pipeline = Pipeline(args.output_dir, project_root, formats, latex_jobs=args.latex_jobs,
+                        pdf_workers=args.pdf_workers, queue_size=args.queue_size)
+
+    start = time.perf_counter()
+    try:
+        stats = asyncio.run(pipeline.run(iter_resumes(args.input, args.input_type)))
+    except FileNotFoundError:
+        print(f"Error: The file {args.input} was not found.")
+        return 1
+    except yaml.YAMLError as e:
+        print(f"Error parsing YAML stream after {pipeline.stats['read']} resumes: {e}")
+        return 1
+    elapsed = time.perf_counter() - start
+
+    print(f"Read {stats['read']}, rendered {stats['rendered']}, LaTeX PDFs {stats['latex']} "
+          f"({stats['latex_passes']} passes), WeasyPrint PDFs {stats['weasyprint']}, errors {stats['errors']} in {elapsed:.1f}s")
+    return 1 if stats['errors'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Stream resumes out of large batch exports and render them one at a time.
+
+load_resume_data() and load_yaml_data() read a single document into memory.
+Upstream batch exports instead arrive as one huge multi-document YAML file
+(``---`` separated) or as JSON Lines. The readers here yield one resume at a
+time, and the render pipeline writes each resume out before reading the next,
+so memory stays flat no matter how large the input is.
+
+Usage:
+    python resume_stream.py batch.yaml --format md --format tex -o output/batch
+    python resume_stream.py batch.jsonl --format html -o output/batch
+    cat batch.jsonl | python resume_stream.py - --input-type jsonl --format md
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from functools import lru_cache
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as StreamLoader
+except ImportError:
+    from yaml import SafeLoader as StreamLoader
+
+JSONL_EXTENSIONS = ('.jsonl', '.ndjson')
+OUTPUT_FORMATS = ('md', 'html', 'tex')
+
+
+def detect_input_type(path):
+    """Guess 'jsonl' or 'yaml' from a file name."""
+    return 'jsonl' if path.lower().endswith(JSONL_EXTENSIONS) else 'yaml'
+
+
+def iter_yaml_documents(stream):
+    """Yield each document of a (possibly multi-document) YAML stream."""
+    for document in yaml.load_all(stream, Loader=StreamLoader):
+        if document is not None:
+            yield document
+
+
+def iter_jsonl_documents(stream):
+    """Yield each JSON object of a JSON Lines stream, skipping blank lines."""
+    for line_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            print(f"Error parsing JSON on line {line_number}: {e}. Skipping this line.")
+
+
+def iter_resumes(path, input_type=None):
+    """Yield resume dictionaries from a file path, or stdin if path is '-'."""
+    input_type = input_type or ('yaml' if path == '-' else detect_input_type(path))
+    reader = iter_jsonl_documents if input_type == 'jsonl' else iter_yaml_documents
+
+    if path == '-':
+        stream = sys.stdin
+        close = False
+    else:
+        stream = open(path, 'r', encoding='utf-8')
+        close = True
+    try:
+        for document in reader(stream):
+            if isinstance(document, dict):
+                yield document
+            else:
+                print(f"Warning: Expected a resume mapping, got {type(document)}. Skipping this document.")
+    finally:
+        if close:
+            stream.close()
+
+
+def slugify(text):
+    """Turn a name into a lowercase, filesystem-friendly slug."""
+    slug = re.sub(r'[^a-z0-9]+', '-', str(text).lower()).strip('-')
+    return slug or 'resume'
+
+
+@lru_cache(maxsize=None)
+def load_html_template(project_root):
+    """Load templates/resume_template.html once per project root (and per process)."""
+    from jinja2 import Environment, FileSystemLoader
+    env = Environment(loader=FileSystemLoader(os.path.join(project_root, 'templates')), autoescape=True)
+    return env.get_template('resume_template.html')
+
+
+def make_renderers(formats, project_root):
+    """Build {extension: render(resume_data) -> str} for the requested formats.
+
+    Generators are imported lazily so a Markdown-only run does not need
+    PyLaTeX or Jinja2 installed. LaTeX uses the fast backend, whose output is
+    byte-identical to create_latex_resume(...).dumps().
+    """
+    renderers = {}
+    if 'md' in formats:
+        from generate_readme import generate_markdown
+        renderers['md'] = generate_markdown
+    if 'html' in formats:
+        template = load_html_template(project_root)
+        renderers['html'] = lambda resume_data: template.render(resume_data=resume_data)
+    if 'tex' in formats:
+        from generate_resume_fast import create_latex_source
+        renderers['tex'] = create_latex_source
+    return renderers
+
+
+def render_stream(resumes, renderers, output_dir):
+    """Render each resume from an iterable and write it out before pulling the next.
+
+    Yields the list of paths written for each resume.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    for i, resume_data in enumerate(resumes, start=1):
+        base_name = f"{i:05d}-{slugify(resume_data.get('name', 'resume'))}"
+        written = []
+        for extension, render in renderers.items():
+            try:
+                content = render(resume_data)
+            except Exception as e:
+                print(f"Error rendering {extension} for resume #{i} ({resume_data.get('name')}): {e}")
+                continue
+            output_path = os.path.join(output_dir, f"{base_name}.{extension}")
+            with open(output_path, 'w', encoding='utf-8') as file:
+                file.write(content)
+            written.append(output_path)
+        yield written
+
+
+def main(argv=None):
+    project_root = os.path.dirname(os.path.abspath(__file__))
+
+    parser = argparse.ArgumentParser(description="Render every resume in a multi-document YAML or JSON Lines file.")
+    parser.add_argument('input', help="Multi-document YAML or JSON Lines file, or '-' for stdin")
+    parser.add_argument('--input-type', choices=('yaml', 'jsonl'), help="Override input type detection")
+    parser.add_argument('--format', action='append', choices=OUTPUT_FORMATS, dest='formats',
+                        help="Output format (repeatable, default: md)")
+    parser.add_argument('-o', '--output-dir', default=os.path.join(project_root, 'output', 'batch'))
+    args = parser.parse_args(argv)
+
+    renderers = make_renderers(args.formats or ['md'], project_root)
+
+    count = 0
+    try:
+        for _written in render_stream(iter_resumes(args.input, args.input_type), renderers, args.output_dir):
+            count += 1
+            if count % 1000 == 0:
+                print(f"Rendered {count} resumes...")
+    except FileNotFoundError:
+        print(f"Error: The file {args.input} was not found.")
+        return 1
+    except yaml.YAMLError as e:
+        print(f"Error parsing YAML stream after {count} resumes: {e}")
+        return 1
+
+    print(f"Successfully rendered {count} resumes into {args.output_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
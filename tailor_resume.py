@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Tailor a resume to many job postings with vectorized TF-IDF matching.
+
+Experience responsibilities, projects and skills become TF-IDF vectors over
+the resume's own vocabulary (terms a posting uses that the resume never
+mentions cannot raise any score, so they are dropped). Postings are
+vectorized in batches into a matrix, and one matrix product scores every
+posting against every resume item at once. Each posting then gets a copy of
+the resume keeping only its best-matching responsibilities, projects and
+skills, which goes straight into the existing Markdown/HTML/LaTeX renderers.
+
+Postings are JSON Lines, one object per line with a "description" (and
+optionally "id" and "title"), or a directory of .txt files.
+
+Usage:
+    python tailor_resume.py postings.jsonl -o output/tailored --format md --format tex
+    python tailor_resume.py postings/ --resume resume.yaml --max-responsibilities 2
+"""
+
+import argparse
+import copy
+import math
+import os
+import sys
+import time
+from collections import Counter
+from collections.abc import Mapping
+
+import numpy as np
+import yaml
+
+from generate_resume_artifact import load_yaml_data, tokenize
+from resume_stream import iter_jsonl_documents, make_renderers, slugify
+
+BATCH_SIZE = 1024
+
+
+def extract_items(resume_data):
+    """Return [(kind, key, text), ...] for every unit that can be kept or dropped.
+
+    kind/key are ('responsibility', (job_index, index)), ('project', (section, index))
+    and ('skill', (category, index)). Entries that are not mappings are skipped
+    with a warning, as the renderers do.
+    """
+    items = []
+    for job_index, job in enumerate(resume_data.get('experience') or []):
+        if not isinstance(job, Mapping):
+            print(f"Warning: Expected a dictionary for an item in 'experience', but found {type(job)}. Skipping this item.")
+            continue
+        context = f"{job.get('title', '')} {job.get('company', '')}"
+        for index, responsibility in enumerate(job.get('responsibilities') or []):
+            if isinstance(responsibility, str):
+                items.append(('responsibility', (job_index, index), f"{responsibility} {context}"))
+
+    for section in ('personal_projects', 'open_source_contributions'):
+        for index, project in enumerate(resume_data.get(section) or []):
+            if not isinstance(project, Mapping):
+                print(f"Warning: Expected a dictionary for an item in '{section}', but found {type(project)}. Skipping this item.")
+                continue
+            technologies = project.get('technologies') or []
+            if isinstance(technologies, str):
+                technologies = [technologies]
+            text = ' '.join([str(project.get('name', '')), str(project.get('description', ''))] + list(technologies))
+            items.append(('project', (section, index), text))
+
+    for category, skills in (resume_data.get('skills') or {}).items():
+        if not isinstance(skills, list):
+            continue
+        for index, skill in enumerate(skills):
+            if not isinstance(skill, Mapping):
+                print(f"Warning: Expected a dictionary for a skill item in category '{category}', but found {type(skill)}. Skipping this item.")
+                continue
+            if skill.get('name'):
+                items.append(('skill', (category, index), str(skill['name'])))
+    return items
+
+
+class ResumeTailor:
+    """Scores job postings against one resume and builds tailored copies of it."""
+
+    def __init__(self, resume_data, max_responsibilities=3, max_projects=4, max_skills=8):
+        self.resume_data = resume_data
+        self.max_responsibilities = max_responsibilities
+        self.max_projects = max_projects
+        self.max_skills = max_skills
+
+        self.items = extract_items(resume_data)
+        item_tokens = [Counter(tokenize(text)) for _kind, _key, text in self.items]
+
+        document_frequency = Counter(term for counts in item_tokens for term in counts)
+        self.vocabulary = {term: column for column, term in enumerate(sorted(document_frequency))}
+        item_count = len(self.items)
+        self.idf = np.array(
+            [math.log((1 + item_count) / (1 + document_frequency[term])) + 1 for term in sorted(document_frequency)],
+            dtype=np.float32,
+        )
+        self.item_matrix = self._vectorize_counts(item_tokens)
+
+    def _vectorize_counts(self, token_counts):
+        """Sublinear-TF x IDF rows, L2-normalised, over the resume vocabulary."""
+        matrix = np.zeros((len(token_counts), len(self.vocabulary)), dtype=np.float32)
+        for row, counts in enumerate(token_counts):
+            for term, count in counts.items():
+                column = self.vocabulary.get(term)
+                if column is not None:
+                    matrix[row, column] = 1.0 + math.log(count)
+        matrix *= self.idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
+    def score(self, descriptions):
+        """Cosine similarity of each description to each item, shape (len(descriptions), len(items))."""
+        counts = [Counter(tokenize(description)) for description in descriptions]
+        return self._vectorize_counts(counts) @ self.item_matrix.T
+
+    def score_batches(self, postings, batch_size=BATCH_SIZE):
+        """Yield (posting, scores_row) for an iterable of posting dicts, one matrix product per batch."""
+        batch = []
+        for posting in postings:
+            batch.append(posting)
+            if len(batch) >= batch_size:
+                yield from zip(batch, self.score([p.get('description', '') for p in batch]))
+                batch = []
+        if batch:
+            yield from zip(batch, self.score([p.get('description', '') for p in batch]))
+
+    def tailor(self, scores):
+        """Return a copy of the resume keeping the items that score best for one posting."""
+        by_kind = {'responsibility': {}, 'project': [], 'skill': {}}
+        for (kind, key, _text), item_score in zip(self.items, scores):
+            if kind == 'responsibility':
+                by_kind[kind].setdefault(key[0], []).append((item_score, key[1]))
+            elif kind == 'project':
+                by_kind[kind].append((item_score, key))
+            else:
+                by_kind[kind].setdefault(key[0], []).append((item_score, key[1]))
+
+        tailored = copy.copy(self.resume_data)
+
+        experience = []
+        for job_index, job in enumerate(self.resume_data.get('experience') or []):
+            if not isinstance(job, Mapping):
+                # Already warned about in extract_items(); leave it out of the tailored copy.
+                continue
+            job = dict(job)
+            ranked = sorted(by_kind['responsibility'].get(job_index, []), key=lambda x: -x[0])
+            keep = {index for _score, index in ranked[:self.max_responsibilities]}
+            job['responsibilities'] = [r for i, r in enumerate(job.get('responsibilities') or []) if i in keep]
+            experience.append(job)
+        if experience:
+            tailored['experience'] = experience
+
+        ranked_projects = sorted(by_kind['project'], key=lambda x: -x[0])
+        keep_projects = {key for item_score, key in ranked_projects[:self.max_projects] if item_score > 0}
+        for section in ('personal_projects', 'open_source_contributions'):
+            if self.resume_data.get(section):
+                tailored[section] = [p for i, p in enumerate(self.resume_data[section]) if (section, i) in keep_projects]
+
+        if self.resume_data.get('skills'):
+            skills = {}
+            for category, category_skills in self.resume_data['skills'].items():
+                ranked = by_kind['skill'].get(category, [])
+                # Matching skills first, then the strongest remaining ones by rating.
+                ranked = sorted(ranked, key=lambda x: (-x[0], -skill_rating(category_skills[x[1]])))
+                keep = {index for _score, index in ranked[:self.max_skills]}
+                skills[category] = [s for i, s in enumerate(category_skills) if i in keep]
+            tailored['skills'] = skills
+
+        return tailored
+
+
+def skill_rating(skill):
+    """A skill's numeric rating, or 0 when it is missing or not a number."""
+    rating = skill.get('rating')
+    return rating if isinstance(rating, (int, float)) else 0
+
+
+def iter_postings(path):
+    """Yield posting dicts from a JSON Lines file or a directory of .txt files."""
+    if os.path.isdir(path):
+        for file_name in sorted(os.listdir(path)):
+            if file_name.endswith('.txt'):
+                with open(os.path.join(path, file_name), 'r', encoding='utf-8') as file:
+                    yield {'id': os.path.splitext(file_name)[0], 'description': file.read()}
+        return
+    with open(path, 'r', encoding='utf-8') as file:
+        for index, posting in enumerate(iter_jsonl_documents(file), start=1):
+            if isinstance(posting, str):
+                posting = {'description': posting}
+            posting.setdefault('id', str(index))
+            yield posting
+
+
+def main(argv=None):
+    project_root = os.path.dirname(os.path.abspath(__file__))
+
+    parser = argparse.ArgumentParser(description="Tailor a resume to job postings with TF-IDF matching.")
+    parser.add_argument('postings', help="JSON Lines file of postings or a directory of .txt postings")
+    parser.add_argument('--resume', default=os.path.join(project_root, 'resume.yaml'))
+    parser.add_argument('-o', '--output-dir', default=os.path.join(project_root, 'output', 'tailored'))
+    parser.add_argument('--format', action='append', dest='formats', choices=('md', 'html', 'tex'),
+                        help="Output format (repeatable, default: md)")
+    parser.add_argument('--max-responsibilities', type=int, default=3, help="Per job (default: 3)")
+    parser.add_argument('--max-projects', type=int, default=4, help="Across all project sections (default: 4)")
+    parser.add_argument('--max-skills', type=int, default=8, help="Per skill category (default: 8)")
+    parser.add_argument('--score-only', action='store_true', help="Only score postings; do not render")
+    args = parser.parse_args(argv)
+
+    try:
+        resume_data = load_yaml_data(args.resume)
+    except FileNotFoundError:
+        print(f"Error: The file {args.resume} was not found.")
+        return 1
+    except yaml.YAMLError as e:
+        print(f"Error parsing YAML file {args.resume}: {e}")
+        return 1
+    if not isinstance(resume_data, Mapping):
+        print(f"Error: {args.resume} does not contain a resume mapping.")
+        return 1
+
+    tailor = ResumeTailor(resume_data, args.max_responsibilities, args.max_projects, args.max_skills)
+    renderers = {} if args.score_only else make_renderers(args.formats or ['md'], project_root)
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    count = 0
+    for posting, scores in tailor.score_batches(iter_postings(args.postings)):
+        count += 1
+        if not renderers:
+            continue
+        tailored = tailor.tailor(scores)
+        base_name = slugify(f"{posting['id']}-{posting.get('title', '')}")
+        for extension, render in renderers.items():
+            with open(os.path.join(args.output_dir, f"{base_name}.{extension}"), 'w', encoding='utf-8') as file:
+                file.write(render(tailored))
+    elapsed = time.perf_counter() - start
+
+    print(f"Tailored resume for {count} postings in {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Checks that the fast LaTeX backend stays byte-identical to the PyLaTeX one."""
+
+import io
+import os
+import sys
+import unittest
+from contextlib import redirect_stdout
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from generate_resume import create_latex_resume, load_resume_data  # noqa: E402
+from generate_resume_fast import create_latex_source  # noqa: E402
+
+EDGE_CASES = {
+    'empty contact': {
+        'name': 'Jane Doe',
+        'contact': {},
+        'profile': 'Builds things.',
+    },
+    'non-string responsibility': {
+        'name': 'Jane Doe',
+        'experience': [{
+            'company': 'Acme',
+            'title': 'Engineer',
+            'start_date': '2020',
+            'end_date': 'Present',
+            'responsibilities': ['Shipped the app', 42, None],
+        }],
+    },
+    'string media_urls': {
+        'name': 'Jane Doe',
+        'experience': [{
+            'company': 'Acme',
+            'title': 'Engineer',
+            'responsibilities': ['Shipped the app'],
+            'app_store_url': 'https://apps.apple.com/app/id1',
+            'media_urls': 'https://example.com/video',
+        }],
+    },
+    'odd skill ratings': {
+        'name': 'Jane Doe',
+        'skills': {
+            'programming_languages': [
+                {'name': 'Swift', 'rating': 7},
+                {'name': 'C', 'rating': 0},
+                {'name': 'Rust', 'rating': -1},
+                {'name': 'Go'},
+            ],
+            'tools': [{'name': 'Xcode', 'rating': 3}],
+        },
+    },
+    'education with only a date': {
+        'name': 'Jane Doe',
+        'education': [{'date': '2010'}],
+    },
+}
+
+
+class FastBackendMatchesPyLaTeX(unittest.TestCase):
+
+    def assertSameLatex(self, data):
+        # Both backends print warnings for missing sections; keep the test output clean.
+        with redirect_stdout(io.StringIO()):
+            fast = create_latex_source(data)
+            expected = create_latex_resume(data).dumps()
+        self.assertEqual(fast, expected)
+
+    def test_resume_yaml(self):
+        data = load_resume_data(os.path.join(PROJECT_ROOT, 'resume.yaml'))
+        self.assertIsNotNone(data)
+        self.assertSameLatex(data)
+
+    def test_edge_cases(self):
+        for name, data in EDGE_CASES.items():
+            with self.subTest(name):
+                self.assertSameLatex(data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+"""Tests for the aux-aware LaTeX driver, using a fake compiler instead of TeX."""
+
+import asyncio
+import os
+import stat
+import sys
+import tempfile
+import textwrap
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from latex_driver import LatexError, build_pdf, compile_latex, compile_latex_async  # noqa: E402
+
+# Behaves like pdflatex as far as the driver can tell: the first pass writes
+# a preliminary .aux, the second its final content, and later passes leave it
+# alone. A document containing FAIL writes a broken .aux and exits non-zero.
+# Every run is appended to runs.log in the build directory.
+FAKE_COMPILER = textwrap.dedent('''\
+    import os
+    import sys
+
+    build_dir = next(arg.split('=', 1)[1] for arg in sys.argv if arg.startswith('-output-directory='))
+    tex_path = sys.argv[-1]
+    jobname = os.path.splitext(os.path.basename(tex_path))[0]
+    aux_path = os.path.join(build_dir, jobname + '.aux')
+    with open(os.path.join(build_dir, 'runs.log'), 'a') as log:
+        log.write('run\\n')
+    with open(tex_path) as tex:
+        source = tex.read()
+    if 'FAIL' in source:
+        with open(aux_path, 'w') as aux:
+            aux.write('broken')
+        print('! Undefined control sequence.')
+        sys.exit(1)
+    previous = open(aux_path).read() if os.path.exists(aux_path) else None
+    if 'NEVER-SETTLES' in source:
+        current = str(int(previous or 0) + 1)
+    else:
+        current = 'preliminary' if previous is None else 'final:' + source
+    with open(aux_path, 'w') as aux:
+        aux.write(current)
+    with open(os.path.join(build_dir, jobname + '.pdf'), 'w') as pdf:
+        pdf.write('%PDF-fake ' + current)
+''')
+
+
+class LatexDriverTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.compiler = os.path.join(self.tmp.name, 'fake-pdflatex')
+        with open(self.compiler, 'w') as file:
+            file.write(f"#!{sys.executable}\n" + FAKE_COMPILER)
+        os.chmod(self.compiler, os.stat(self.compiler).st_mode | stat.S_IEXEC)
+        self.build_dir = os.path.join(self.tmp.name, 'build')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_tex(self, content, name='resume'):
+        tex_path = os.path.join(self.tmp.name, f"{name}.tex")
+        with open(tex_path, 'w') as file:
+            file.write(content)
+        return tex_path
+
+    def runs(self):
+        with open(os.path.join(self.build_dir, 'runs.log')) as log:
+            return len(log.readlines())
+
+    def test_reruns_until_aux_is_stable(self):
+        tex_path = self.write_tex('hello')
+        # preliminary -> final -> final: the third pass confirms nothing changed.
+        self.assertEqual(compile_latex(tex_path, self.build_dir, compiler=self.compiler), 3)
+
+    def test_reusing_previous_aux_needs_one_pass(self):
+        tex_path = self.write_tex('hello')
+        compile_latex(tex_path, self.build_dir, compiler=self.compiler)
+        self.assertEqual(compile_latex(tex_path, self.build_dir, compiler=self.compiler), 1)
+
+    def test_edited_document_reruns(self):
+        tex_path = self.write_tex('hello')
+        compile_latex(tex_path, self.build_dir, compiler=self.compiler)
+        self.write_tex('hello again')
+        self.assertEqual(compile_latex(tex_path, self.build_dir, compiler=self.compiler), 2)
+
+    def test_stops_at_max_passes(self):
+        tex_path = self.write_tex('NEVER-SETTLES')
+        with redirect_stdout(StringIO()) as output:
+            passes = compile_latex(tex_path, self.build_dir, compiler=self.compiler, max_passes=3)
+        self.assertEqual(passes, 3)
+        self.assertIn('still changing', output.getvalue())
+
+    def test_failed_pass_removes_aux_files(self):
+        tex_path = self.write_tex('FAIL')
+        with self.assertRaises(LatexError) as raised:
+            compile_latex(tex_path, self.build_dir, compiler=self.compiler)
+        self.assertIn('Undefined control sequence', str(raised.exception))
+        self.assertFalse(os.path.exists(os.path.join(self.build_dir, 'resume.aux')))
+
+        # The fixed document starts from a clean build directory.
+        self.write_tex('fixed')
+        self.assertEqual(compile_latex(tex_path, self.build_dir, compiler=self.compiler), 3)
+
+    def test_async_matches_sync(self):
+        tex_path = self.write_tex('hello')
+        self.assertEqual(asyncio.run(compile_latex_async(tex_path, self.build_dir, compiler=self.compiler)), 3)
+        self.assertEqual(asyncio.run(compile_latex_async(tex_path, self.build_dir, compiler=self.compiler)), 1)
+        self.assertEqual(self.runs(), 4)
+
+    def test_build_pdf_copies_pdf_next_to_tex(self):
+        tex_path = self.write_tex('hello')
+        pdf_path, passes = build_pdf(tex_path, self.build_dir, compiler=self.compiler)
+        self.assertEqual(pdf_path, os.path.join(self.tmp.name, 'resume.pdf'))
+        self.assertEqual(passes, 3)
+        with open(pdf_path) as pdf:
+            self.assertTrue(pdf.read().startswith('%PDF-fake final:'))
+
+
+if __name__ == '__main__':
+    unittest.main()
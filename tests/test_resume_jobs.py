@@ -0,0 +1,108 @@
+"""Tests for the SQLite job queue: leasing, retries and several worker processes."""
+
+import io
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+import resume_jobs  # noqa: E402
+from resume_jobs import JobQueue  # noqa: E402
+
+
+def sample_resumes(count):
+    return [{'name': f"Candidate {i}", 'profile': f"Profile {i}"} for i in range(count)]
+
+
+class JobQueueTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, 'jobs.db')
+        self.queue = JobQueue(self.db_path)
+
+    def tearDown(self):
+        self.queue.close()
+        self.tmp.cleanup()
+
+    def job_row(self, job_id):
+        return self.queue.conn.execute(
+            "SELECT status, attempts, lease_owner FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+
+    def test_leased_job_is_not_leased_twice(self):
+        self.queue.enqueue('batch.yaml', sample_resumes(1), ['md'])
+        job = self.queue.lease('worker-1')
+        self.assertIsNotNone(job)
+        with JobQueue(self.db_path) as other:
+            self.assertIsNone(other.lease('worker-2'))
+        self.assertTrue(self.queue.complete(job['id'], 'worker-1', []))
+        self.assertEqual(self.queue.counts(), {'done': 1})
+
+    def test_expired_lease_is_requeued(self):
+        self.queue.enqueue('batch.yaml', sample_resumes(1), ['md'])
+        job = self.queue.lease('worker-1', lease_seconds=0.05)
+        time.sleep(0.1)
+        retried = self.queue.lease('worker-2')
+        self.assertEqual(retried['id'], job['id'])
+        self.assertEqual(retried['attempts'], 2)
+        # The first worker lost its lease and can no longer finish the job.
+        self.assertFalse(self.queue.complete(job['id'], 'worker-1', []))
+        self.assertFalse(self.queue.heartbeat(job['id'], 'worker-1'))
+        self.assertTrue(self.queue.complete(job['id'], 'worker-2', []))
+
+    def test_failed_job_backs_off_then_gives_up(self):
+        self.queue.enqueue('batch.yaml', sample_resumes(1), ['md'], max_attempts=2)
+        job = self.queue.lease('worker-1')
+        self.assertTrue(self.queue.fail(job['id'], 'worker-1', 'boom', retry_delay=60.0))
+        self.assertEqual(self.job_row(job['id'])[:2], ('queued', 1))
+        # Still backing off.
+        self.assertIsNone(self.queue.lease('worker-1'))
+
+        self.queue.conn.execute("UPDATE jobs SET available_at = 0 WHERE id = ?", (job['id'],))
+        job = self.queue.lease('worker-1')
+        self.assertEqual(job['attempts'], 2)
+        self.assertTrue(self.queue.fail(job['id'], 'worker-1', 'boom again', retry_delay=0.0))
+        self.assertEqual(self.job_row(job['id'])[:2], ('failed', 2))
+        self.assertIsNone(self.queue.lease('worker-1'))
+
+    def test_enqueue_is_idempotent(self):
+        self.assertEqual(self.queue.enqueue('batch.yaml', sample_resumes(3), ['md']), 3)
+        self.assertEqual(self.queue.enqueue('batch.yaml', sample_resumes(5), ['md']), 2)
+        self.assertEqual(self.queue.counts(), {'queued': 5})
+
+
+class WorkerProcessesTest(unittest.TestCase):
+
+    def test_several_processes_finish_each_job_once(self):
+        job_count = 24
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, 'jobs.db')
+            input_path = os.path.join(tmp, 'batch.jsonl')
+            output_dir = os.path.join(tmp, 'out')
+            with open(input_path, 'w', encoding='utf-8') as file:
+                for resume_data in sample_resumes(job_count):
+                    file.write(json.dumps(resume_data) + '\n')
+
+            with redirect_stdout(io.StringIO()):
+                self.assertEqual(resume_jobs.main(['--db', db_path, 'enqueue', input_path, '--format', 'md']), 0)
+                self.assertEqual(resume_jobs.main(['--db', db_path, 'worker', '-o', output_dir,
+                                                   '--processes', '3', '--idle-exit', '0.5']), 0)
+
+            conn = sqlite3.connect(db_path)
+            rows = conn.execute("SELECT status, attempts FROM jobs").fetchall()
+            conn.close()
+            self.assertEqual(len(rows), job_count)
+            self.assertEqual(set(rows), {('done', 1)})
+            self.assertEqual(len([name for name in os.listdir(output_dir) if name.endswith('.md')]), job_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""Checks that every generator renders a Resume model exactly like the dict it came from."""
+
+import copy
+import io
+import os
+import sys
+import unittest
+from contextlib import redirect_stdout
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from generate_readme import generate_markdown  # noqa: E402
+from generate_resume import create_latex_resume, load_resume_data  # noqa: E402
+from generate_resume_fast import create_latex_source  # noqa: E402
+from resume_model import Resume  # noqa: E402
+from resume_stream import load_html_template  # noqa: E402
+
+RENDERERS = {
+    'markdown': generate_markdown,
+    'latex (PyLaTeX)': lambda data: create_latex_resume(data).dumps(),
+    'latex (fast)': create_latex_source,
+    'html': lambda data: load_html_template(PROJECT_ROOT).render(resume_data=data),
+}
+
+
+def load_cases():
+    resume = load_resume_data(os.path.join(PROJECT_ROOT, 'resume.yaml'))
+    sparse = copy.deepcopy(resume)
+    # Explicit nulls and missing keys must stay distinguishable.
+    sparse['experience'][0]['end_date'] = None
+    del sparse['experience'][1]['location']
+    sparse['education'] = [{'institution': 'Somewhere', 'degree': 'BSc', 'date': '2010', 'major': None}]
+    del sparse['open_source_contributions']
+    return {'resume.yaml': resume, 'nulls and missing keys': sparse}
+
+
+class ResumeModelParity(unittest.TestCase):
+
+    def test_to_dict_round_trips(self):
+        for name, data in load_cases().items():
+            with self.subTest(name):
+                self.assertEqual(Resume.from_dict(data).to_dict(), data)
+
+    def test_generators_render_model_like_dict(self):
+        for case, data in load_cases().items():
+            model = Resume.from_dict(data)
+            for renderer_name, render in RENDERERS.items():
+                with self.subTest(case=case, renderer=renderer_name):
+                    with redirect_stdout(io.StringIO()):
+                        expected = render(data)
+                        actual = render(model)
+                    self.assertEqual(actual, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()